@@ -1,9 +1,12 @@
 # pac_cli/app/core/agent_runner.py
 import subprocess
+import functools
 import json
+import selectors
 import shlex
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 import logging
 import os # For environment variables
 
@@ -14,8 +17,19 @@ import os # For environment variables
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=32)
+def _split_agent_cmd(cmd: str) -> Tuple[str, ...]:
+    """
+    Tokenized agent command string, cached. shlex.split is a pure-Python
+    state machine and the same configured path string is re-parsed by every
+    runner construction plus `system check`, so the tuple is shared.
+    """
+    return tuple(shlex.split(cmd))
+
+
 class AgentExecutionError(Exception):
-    """Custom exception for agent execution failures.".""
+    """Custom exception for agent execution failures."""
     def __init__(self, message: str, stdout: Optional[str] = None, stderr: Optional[str] = None, return_code: Optional[int] = None):
         super().__init__(message)
         self.stdout = stdout
@@ -23,29 +37,48 @@ class AgentExecutionError(Exception):
         self.return_code = return_code
 
 class BaseAgentRunner:
-    """Base class for running external agents like Ex-Work and Scribe.".""
+    """Base class for running external agents like Ex-Work and Scribe."""
+
+    # Size of the reusable read buffer for draining agent stdout/stderr.
+    # 64 KB matches the default pipe capacity on Linux, so each read syscall
+    # can drain everything the kernel has buffered.
+    _READ_BUF_SIZE = 65536
+
     def __init__(self, agent_name: str, agent_script_path_str: Optional[str], config_manager: Any): # config_manager is type 'ConfigManager'
         self.agent_name = agent_name
         self.agent_script_path_str = agent_script_path_str # Full command string, e.g., "python /path/to/agent.py"
         self.config_manager = config_manager
         self.agent_script_command: List[str] = []
+        # Preallocated once per runner and reused for every subprocess read,
+        # instead of letting each read allocate a fresh chunk.
+        self._read_buf = bytearray(self._READ_BUF_SIZE)
 
         if not self.agent_script_path_str:
             logger.error(f"Path for {self.agent_name} is not configured. It cannot be run.")
             # Agent runner will be unusable, but don't crash PAC init for this.
             # Calls to run() should handle this.
         else:
-            self.agent_script_command = shlex.split(self.agent_script_path_str)
+            self.agent_script_command = list(_split_agent_cmd(self.agent_script_path_str))
             # Basic validation of the command (e.g., script exists if it's a path)
             if not self.agent_script_command:
                  logger.error(f"Agent command string '{self.agent_script_path_str}' for {self.agent_name} is empty after shlex.split.")
             # Further validation could occur here (e.g. if self.agent_script_command[0] == "python", check if self.agent_script_command[1] exists)
 
-    def _prepare_env(self, project_env_vars: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        """Prepares the environment for the agent subprocess.".""
+    def _prepare_env(self, project_env_vars: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+        """Prepares the environment for the agent subprocess.
+
+        Returns None when the child needs no env changes, so subprocess lets the
+        kernel inherit the parent environment directly instead of serializing a
+        fully-specified env block for every agent invocation. NPT_BASE_DIR is
+        exported into PAC's own environment at startup (see main_callback), so
+        the common no-override case needs no copy at all.
+        """
         # TODO, Architect: More sophisticated venv activation/management if agents need specific project venvs.
         # For now, assumes agents can run in PAC's venv or find their own way if they are complex.
         # The copied agents (Scribe, Ex-Work) will have their deps in PAC's venv.
+        if not project_env_vars and "NPT_BASE_DIR" in os.environ:
+            return None
+
         env = os.environ.copy()
         if project_env_vars:
             env.update(project_env_vars)
@@ -55,6 +88,76 @@ class BaseAgentRunner:
             env["NPT_BASE_DIR"] = str(self.config_manager.npt_base_dir)
         return env
 
+    def _communicate(self,
+                     process: subprocess.Popen,
+                     stdin_data: Optional[str],
+                     timeout_seconds: Optional[int]) -> Tuple[bytes, bytes]:
+        """
+        Feeds stdin to the agent and drains stdout/stderr until EOF.
+
+        All pipe reads go through the runner's preallocated 64 KB bytearray
+        (readinto) rather than subprocess.communicate's per-read allocations,
+        which matters for agents that stream large JSON payloads. Raises
+        subprocess.TimeoutExpired like communicate() would.
+        """
+        deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
+        stdout_acc = bytearray()
+        stderr_acc = bytearray()
+        input_view = memoryview(stdin_data.encode("utf-8")) if stdin_data is not None else None
+        sent = 0
+
+        sel = selectors.DefaultSelector()
+        sel.register(process.stdout, selectors.EVENT_READ, "stdout")
+        sel.register(process.stderr, selectors.EVENT_READ, "stderr")
+        if process.stdin is not None:
+            if input_view is not None and len(input_view):
+                os.set_blocking(process.stdin.fileno(), False)
+                sel.register(process.stdin, selectors.EVENT_WRITE, "stdin")
+            else:
+                process.stdin.close()
+
+        buf = self._read_buf
+        view = memoryview(buf)
+        try:
+            while sel.get_map():
+                select_timeout = None
+                if deadline is not None:
+                    select_timeout = deadline - time.monotonic()
+                    if select_timeout <= 0:
+                        process.kill()
+                        process.wait()
+                        raise subprocess.TimeoutExpired(process.args, timeout_seconds)
+                for key, _ in sel.select(select_timeout):
+                    if key.data == "stdin":
+                        try:
+                            sent += os.write(key.fileobj.fileno(), input_view[sent:sent + self._READ_BUF_SIZE])
+                        except BrokenPipeError:
+                            sent = len(input_view) # Agent closed stdin early; stop feeding
+                        if sent >= len(input_view):
+                            sel.unregister(key.fileobj)
+                            key.fileobj.close()
+                    else:
+                        n = key.fileobj.readinto(buf)
+                        if not n:
+                            sel.unregister(key.fileobj)
+                            key.fileobj.close()
+                        else:
+                            (stdout_acc if key.data == "stdout" else stderr_acc).extend(view[:n])
+        finally:
+            sel.close()
+
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            process.wait(timeout=remaining)
+        except subprocess.TimeoutExpired:
+            # Pipes are at EOF but the child lingers (e.g. blocked in atexit):
+            # kill and reap it before surfacing the timeout, same as the
+            # in-loop deadline path, so no zombie is left behind.
+            process.kill()
+            process.wait()
+            raise
+        return bytes(stdout_acc), bytes(stderr_acc)
+
     def run(self,
             args: Optional[List[str]] = None, # For agents that take CLI args
             stdin_data: Optional[str] = None,    # For agents that take stdin
@@ -65,7 +168,7 @@ class BaseAgentRunner:
         """
         Runs the configured agent.
         Returns: (success_bool, output_json_dict_or_error_payload, raw_stdout, raw_stderr)
-        ".""
+        """
         if not self.agent_script_command:
             error_msg = f"{self.agent_name} path not configured or invalid. Cannot execute."
             logger.error(error_msg)
@@ -85,19 +188,27 @@ class BaseAgentRunner:
         process_env = self._prepare_env(project_env_vars)
 
         try:
-            process = subprocess.run(
+            process = subprocess.Popen(
                 command_to_run,
-                input=stdin_data.encode('utf-8') if stdin_data is not None else None,
-                capture_output=True,
-                text=True,
+                stdin=subprocess.PIPE if stdin_data is not None else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0, # Unbuffered pipes: readinto is a single syscall into our reusable buffer
                 cwd=effective_cwd,
-                env=process_env,
-                timeout=effective_timeout,
-                check=False # We handle return codes
+                env=process_env, # None means: inherit parent env, no env-block allocation
             )
+            try:
+                stdout_bytes, stderr_bytes = self._communicate(process, stdin_data, effective_timeout)
+            except Exception:
+                # Whatever went wrong mid-exchange, never leave the child
+                # running and unreaped before the handlers below report it.
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                raise
 
-            stdout_str = process.stdout.strip() if process.stdout else ""
-            stderr_str = process.stderr.strip() if process.stderr else ""
+            stdout_str = stdout_bytes.decode("utf-8", errors="replace").strip()
+            stderr_str = stderr_bytes.decode("utf-8", errors="replace").strip()
 
             logger.debug(f"{self.agent_name} RC: {process.returncode}")
             if stdout_str: logger.debug(f"{self.agent_name} STDOUT:\n{stdout_str}")
@@ -145,10 +256,17 @@ class ExWorkAgentRunner(BaseAgentRunner):
         agent_path = config_manager.get("agents.ex_work_agent_path")
         super().__init__("Ex-Work Agent", agent_path, config_manager)
 
-    def execute_instruction_block(self, instruction_json_str: str, project_path: Path, timeout_seconds: Optional[int] = None) -> Tuple[bool, Dict[str, Any]]:
-        """Sends a JSON instruction block to Ex-Work via stdin and gets JSON response.".""
+    def execute_instruction_block(self, instruction_block: Union[str, Dict[str, Any]], project_path: Path, timeout_seconds: Optional[int] = None) -> Tuple[bool, Dict[str, Any]]:
+        """Sends a JSON instruction block (raw string or parsed dict) to Ex-Work via stdin and gets JSON response."""
         if not self.agent_script_command: return False, {"error": "Ex-Work agent not configured."}
 
+        if isinstance(instruction_block, str):
+            instruction_json_str = instruction_block
+        else:
+            # Callers that already validated/parsed the block pass the dict;
+            # serialize compactly once instead of round-tripping the raw text.
+            instruction_json_str = json.dumps(instruction_block, separators=(",", ":"))
+
         success, output_data, raw_stdout, raw_stderr = self.run(
             stdin_data=instruction_json_str,
             cwd=project_path,
@@ -158,6 +276,26 @@ class ExWorkAgentRunner(BaseAgentRunner):
         # If !success, output_data contains the error payload from BaseAgentRunner.
         return success, output_data
 
+    def execute_instruction_blocks(self,
+                                   instruction_blocks: List[Dict[str, Any]],
+                                   project_path: Path,
+                                   timeout_seconds: Optional[int] = None) -> List[Tuple[bool, Dict[str, Any]]]:
+        """
+        Runs several instruction blocks through Ex-Work, returning one
+        (success, payload) tuple per block in order. The agent accepts a
+        single JSON object per invocation (process_instruction_block rejects
+        arrays), so each block gets its own subprocess round-trip; batching
+        them into one spawn can happen once the agent understands arrays.
+        """
+        if not instruction_blocks:
+            return []
+        if not self.agent_script_command:
+            return [(False, {"error": "Ex-Work agent not configured."})] * len(instruction_blocks)
+        return [
+            self.execute_instruction_block(block, project_path, timeout_seconds)
+            for block in instruction_blocks
+        ]
+
 class ScribeAgentRunner(BaseAgentRunner):
     def __init__(self, config_manager: Any): # ConfigManager type
         agent_path = config_manager.get("agents.scribe_agent_path")
@@ -174,7 +312,7 @@ class ScribeAgentRunner(BaseAgentRunner):
                        skip_review: bool = False,
                        timeout_seconds: Optional[int] = None
                       ) -> Tuple[bool, Dict[str, Any]]:
-        """Constructs Scribe CLI args and runs it.".""
+        """Constructs Scribe CLI args and runs it."""
         if not self.agent_script_command: return False, {"error": "Scribe agent not configured."}
 
         args = [
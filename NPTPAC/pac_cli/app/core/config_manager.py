@@ -1,8 +1,10 @@
 # pac_cli/app/core/config_manager.py
+import hashlib
+import json
 import os
 import toml
 from pathlib import Path
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__) # Assuming PAC's main.py sets up a root logger
@@ -12,8 +14,14 @@ logger = logging.getLogger(__name__) # Assuming PAC's main.py sets up a root log
 DEFAULT_PAC_CONFIG_DIR_NAME = "config"
 DEFAULT_SETTINGS_FILENAME = "settings.toml"
 
+# In-process memo of parsed user TOML keyed by (path, mtime_ns): constructing
+# several ConfigManagers in one process costs one parse, not N. Only the user
+# document is memoized — defaults embed dynamic values ($EDITOR, paths derived
+# from npt_base_dir) and are recomputed and merged on every load.
+_SETTINGS_MEMO: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
 class ConfigManager:
-    """Manages PAC's configuration settings, loaded from a TOML file.".""
+    """Manages PAC's configuration settings, loaded from a TOML file."""
     def __init__(self, npt_base_dir: Path, config_filename: Optional[str] = None):
         self.npt_base_dir = npt_base_dir
         self.config_dir = self.npt_base_dir / DEFAULT_PAC_CONFIG_DIR_NAME
@@ -21,6 +29,17 @@ class ConfigManager:
         self.settings: Dict[str, Any] = {}
         self._load_settings()
 
+    @classmethod
+    def from_dict(cls, npt_base_dir: Path, settings: Dict[str, Any],
+                  config_filename: Optional[str] = None) -> "ConfigManager":
+        """Builds a manager around an already-merged settings dict, skipping the TOML parse."""
+        manager = cls.__new__(cls)
+        manager.npt_base_dir = npt_base_dir
+        manager.config_dir = npt_base_dir / DEFAULT_PAC_CONFIG_DIR_NAME
+        manager.settings_file_path = manager.config_dir / (config_filename or DEFAULT_SETTINGS_FILENAME)
+        manager.settings = settings
+        return manager
+
     def _ensure_config_dir_exists(self):
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -29,24 +48,79 @@ class ConfigManager:
             # Depending on severity, could raise an exception or allow running with defaults.
             # For now, log and proceed, load_settings will use defaults.
 
+    @property
+    def _cache_file_path(self) -> Path:
+        """JSON sidecar holding the pre-parsed user TOML document."""
+        return self.settings_file_path.with_name(self.settings_file_path.stem + ".cache.json")
+
+    def _load_cache(self, raw_toml: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Parsed user TOML from the JSON sidecar, or None on any mismatch.
+        json.loads of the small blob is an order of magnitude cheaper than a
+        TOML parse; the stored sha1 of the TOML bytes guards staleness. Only
+        the user document is cached — never the merged settings, whose
+        defaults depend on the environment and npt_base_dir.
+        """
+        try:
+            with open(self._cache_file_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if cache.get("sha1") != hashlib.sha1(raw_toml).hexdigest():
+            return None
+        user = cache.get("user")
+        return user if isinstance(user, dict) else None
+
+    def _write_cache(self, raw_toml: bytes, user_settings: Dict[str, Any]) -> None:
+        """Writes the sidecar atomically (tmp file + os.replace). Best-effort."""
+        cache_path = self._cache_file_path
+        tmp_path = f"{cache_path}.tmp.{os.getpid()}"
+        try:
+            payload = json.dumps({"sha1": hashlib.sha1(raw_toml).hexdigest(), "user": user_settings})
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write settings cache {cache_path}: {e}")
+
     def _load_settings(self):
         self._ensure_config_dir_exists()
         defaults = self._get_default_settings()
 
         if self.settings_file_path.exists() and self.settings_file_path.is_file():
             try:
-                with open(self.settings_file_path, "r", encoding="utf-8") as f:
-                    user_settings = toml.load(f)
-
-                # Deep merge user settings onto defaults
-                self.settings = self._merge_dicts(defaults, user_settings)
-                logger.info(f"Loaded PAC settings from: {self.settings_file_path}")
-            except toml.TomlDecodeError as e:
-                logger.error(f"Error decoding TOML from {self.settings_file_path}: {e}. Using default settings.")
-                self.settings = defaults
+                raw_toml = self.settings_file_path.read_bytes()
+                settings_mtime_ns = os.stat(self.settings_file_path).st_mtime_ns
             except OSError as e:
                 logger.error(f"Error reading settings file {self.settings_file_path}: {e}. Using default settings.")
                 self.settings = defaults
+                return
+
+            # Fast paths for the user TOML parse: in-process memo, then the
+            # pre-parsed JSON sidecar. The mtime_ns/sha1 keys self-invalidate
+            # whenever the TOML changes.
+            memo_key = (str(self.settings_file_path), settings_mtime_ns)
+            user_settings = _SETTINGS_MEMO.get(memo_key)
+            if user_settings is None:
+                user_settings = self._load_cache(raw_toml)
+                if user_settings is not None:
+                    _SETTINGS_MEMO[memo_key] = user_settings
+                    logger.debug(f"Loaded PAC settings from cache sidecar for: {self.settings_file_path}")
+            if user_settings is None:
+                try:
+                    user_settings = toml.loads(raw_toml.decode("utf-8"))
+                except (toml.TomlDecodeError, UnicodeDecodeError) as e:
+                    logger.error(f"Error decoding TOML from {self.settings_file_path}: {e}. Using default settings.")
+                    self.settings = defaults
+                    return
+                logger.info(f"Loaded PAC settings from: {self.settings_file_path}")
+                self._write_cache(raw_toml, user_settings)
+                _SETTINGS_MEMO[memo_key] = user_settings
+
+            # Deep merge user settings onto *fresh* defaults every load:
+            # defaults carry dynamic values ($EDITOR, npt_base_dir-derived
+            # paths) that must never be frozen into a cache.
+            self.settings = self._merge_dicts(defaults, user_settings)
         else:
             logger.info(f"PAC settings file not found at {self.settings_file_path}. Using default settings and creating a new one.")
             self.settings = defaults
@@ -98,6 +172,8 @@ class ConfigManager:
             with open(self.settings_file_path, "w", encoding="utf-8") as f:
                 toml.dump(self.settings, f)
             logger.info(f"PAC settings saved to: {self.settings_file_path}")
+            # Keep the sidecar in step so the next startup takes the fast path.
+            self._write_cache(self.settings_file_path.read_bytes(), self.settings)
             return True
         except OSError as e:
             logger.error(f"Failed to save PAC settings to {self.settings_file_path}: {e}")
@@ -116,7 +192,7 @@ class ConfigManager:
             return default
 
     def set_value(self, key_path: str, value: Any):
-        """Set a configuration value using a dot-separated path and save.".""
+        """Set a configuration value using a dot-separated path and save."""
         keys = key_path.split('.')
         current_level = self.settings
         for i, key in enumerate(keys[:-1]):
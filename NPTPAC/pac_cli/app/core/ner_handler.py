@@ -1,139 +1,816 @@
 # pac_cli/app/core/ner_handler.py
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Tuple, Union
+import concurrent.futures
+import functools
 import os
 import logging
 import json # For manifest.json or other structured NER files
+import mmap
+import queue
+import re
+import shutil
+import stat
+import subprocess
+import threading
 import yaml # If using YAML for some NER content
+import zlib
+
+try:
+    import orjson # SIMD-accelerated JSON parsing, used when installed
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import re2 as _scan_re # google-re2: DFA matching, no backtracking, used when installed
+except ImportError:
+    _scan_re = re
+
+# libyaml's C loader when PyYAML was built against it; 5-20x the pure-Python one.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 logger = logging.getLogger(__name__)
 
+# Persistent search index location (inside the NER, dot-prefixed so the
+# normal walks skip it) and the tokenizer used for both indexing and queries.
+_INDEX_DIR_NAME = ".ner_index"
+_INDEX_FILE_NAME = "index.json"
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+# Per-file trigram Bloom filter width. ~256 bytes/file buys sub-millisecond
+# negative lookups: candidates whose filter lacks any query trigram are
+# dropped without ever being opened.
+_BLOOM_BITS = 2048
+
+# Content-search guards: very large files are skipped outright, and files too
+# big to be worth caching lowered copies of are scanned in place via mmap.
+_MAX_SEARCH_BYTES = 8 * 1024 * 1024
+_CACHE_MAX_BYTES = 256 * 1024
+
+# Candidate batch size handed from the directory-walk producer thread to the
+# content-scanning consumer in _search_python.
+_PREFETCH_BATCH = 512
+
+# Extensions worth content-searching. Anything else (images, archives,
+# binaries) is skipped before any open/read; extensionless files (LICENSE,
+# Makefile, ...) are still treated as text candidates.
+_TEXT_EXTS = frozenset({
+    "md", "txt", "json", "yaml", "yml", "toml", "py", "sh", "cfg", "ini",
+    "csv", "rst", "xml", "html", "js", "ts", "css", "log", "env",
+    "template", "j2", "jinja", "exwork", "scribe", "workflow",
+})
+
+
+def _bloom_bits_for(grams: "set[bytes]") -> "set[int]":
+    """
+    Bit positions for a set of trigrams: three crc32-derived hashes each.
+    Deterministic and dependency-free, so filters built by one process are
+    readable by any other.
+    """
+    bits = set()
+    for gram in grams:
+        h1 = zlib.crc32(gram)
+        h2 = zlib.crc32(gram, 0x9747B28C)
+        bits.add(h1 % _BLOOM_BITS)
+        bits.add(h2 % _BLOOM_BITS)
+        bits.add((h1 ^ h2) % _BLOOM_BITS)
+    return bits
+
+
+def _trigrams(data: bytes) -> "set[bytes]":
+    return {data[i:i + 3] for i in range(len(data) - 2)}
+
+
+def _mmap_contains(path_str: str, pattern: "re.Pattern[bytes]") -> bool:
+    """
+    Case-insensitive byte search over a memory-mapped file.
+
+    No read into Python, no UTF-8 decode, no lowered copy: the kernel pages
+    the file in and re's C engine scans the mapping directly. Files whose
+    first KB contains a NUL are treated as binary and reported as non-matching
+    (the same heuristic grep/ripgrep use).
+    """
+    try:
+        fd = os.open(path_str, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        try:
+            mm = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        except (OSError, ValueError): # e.g. empty or truncated-under-us files
+            return False
+        with mm:
+            if b"\x00" in mm[:1024]:
+                return False
+            return pattern.search(mm) is not None
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_query_patterns(terms_lc: Tuple[str, ...]) -> Tuple["re.Pattern[bytes]", "re.Pattern[str]"]:
+    """
+    Compiled (bytes-scan, str-snippet) patterns for a term set, cached.
+
+    Long-running PAC sessions repeat the same queries (template lookups), so
+    the alternation patterns are compiled once per distinct term set instead
+    of on every search call. The bytes pattern that runs over whole file
+    contents compiles under google-re2 when installed (linear-time DFA scan);
+    escaped-literal alternations compile identically under both engines.
+    """
+    escaped_bytes = b"|".join(re.escape(t.encode("utf-8")) for t in terms_lc)
+    try:
+        pattern_bytes = _scan_re.compile(escaped_bytes, _scan_re.IGNORECASE)
+    except Exception: # pragma: no cover - re2 rejects what stdlib accepts
+        pattern_bytes = re.compile(escaped_bytes, re.IGNORECASE)
+    pattern_str = re.compile("|".join(map(re.escape, terms_lc)), re.IGNORECASE)
+    return pattern_bytes, pattern_str
+
+
+@functools.lru_cache(maxsize=256)
+def _read_text(path_str: str, mtime_ns: int) -> str:
+    """
+    Decoded file text, cached by (path, mtime_ns). Template bodies and edicts
+    get re-requested across browse/assemble/run flows within one process;
+    the mtime key self-invalidates on edit. Read/decode errors propagate to
+    the caller (lru_cache does not cache raised exceptions).
+    """
+    with open(path_str, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=4096)
+def _lower_content(path_str: str, mtime_ns: int) -> Optional[bytes]:
+    """
+    Returns the lowercased raw bytes of a file, cached by (path, mtime_ns).
+
+    Repeated searches hit the cache instead of re-reading and re-lowercasing
+    the same unchanged files; the mtime key self-invalidates on edit. Bytes
+    (not str) so presence checks stay a C-level bytes.find with no decode.
+    """
+    try:
+        with open(path_str, "rb") as f:
+            return f.read().lower()
+    except OSError:
+        return None
+
 class NERHandler:
-    """Handles Browse, reading, and managing content within the NER.".""
+    """Handles Browse, reading, and managing content within the NER."""
     def __init__(self, ner_root_path: Path, config_manager: Optional[Any] = None): # config_manager for future use (e.g. NER validation schemas)
-        self.ner_root = ner_root_path.resolve()
+        # Root resolution/validation is deferred to first use: PAC can create
+        # short-lived handlers, and resolving + stat-ing the root on every
+        # construction is wasted work for handlers that never touch disk.
+        self._raw_root = ner_root_path
         self.config_manager = config_manager # Placeholder for using config
-        if not self.ner_root.is_dir():
+        # ripgrep, when installed, does the content scanning for search_ner:
+        # it memory-maps files and scans with a SIMD literal matcher instead of
+        # PAC reading and lowercasing every file in Python.
+        self._rg_path = shutil.which("rg")
+        # Persistent inverted index (built by reindex(), refreshed on commit):
+        # turns content queries from O(total NER bytes) into O(matching postings).
+        self._index: Optional[Dict[str, Any]] = None
+        self._index_mtime_ns: Optional[int] = None
+
+    @functools.cached_property
+    def ner_root(self) -> Path:
+        """Resolved NER root; validated once, on first access.
+
+        os.path.realpath resolves the whole root in one C call, vs
+        Path.resolve() stat-ing component by component.
+        """
+        root = Path(os.path.realpath(self._raw_root))
+        if not root.is_dir():
             # This should ideally be caught by PAC's main startup check.
-            logger.critical(f"NER root path does not exist or is not a directory: {self.ner_root}")
-            raise FileNotFoundError(f"NER root path not found: {self.ner_root}")
+            logger.critical(f"NER root path does not exist or is not a directory: {root}")
+            raise FileNotFoundError(f"NER root path not found: {root}")
+        return root
+
+    # Cached string forms of the root: every entry point needs them for
+    # containment checks and relative-path computation, so pay str() once.
+    @functools.cached_property
+    def _ner_root_str(self) -> str:
+        return str(self.ner_root)
+
+    @functools.cached_property
+    def _ner_root_prefix(self) -> str:
+        return self._ner_root_str + os.sep
+
+    @functools.cached_property
+    def _index_file(self) -> str:
+        return os.path.join(self._ner_root_str, _INDEX_DIR_NAME, _INDEX_FILE_NAME)
+
+    def _safe_abs(self, rel: str) -> Optional[str]:
+        """
+        Absolute path for a NER-relative path, or None if it escapes the root.
+        os.path.realpath resolves the assembled string (symlinks included) in
+        one pass, instead of Path.resolve's per-segment lstat walk, and the
+        containment test is a plain string prefix check.
+        """
+        abs_path = os.path.realpath(os.path.join(self._ner_root_prefix, rel))
+        if abs_path.startswith(self._ner_root_prefix) or abs_path == self._ner_root_str:
+            return abs_path
+        return None
+
+    def _iter_entries(self, root: str, recursive: bool):
+        """
+        Stack-based os.scandir walk yielding os.DirEntry objects (files and
+        directories), pruning dot-entries by name. DirEntry type checks come
+        straight from the getdents results, so the walk issues no per-entry
+        stat syscalls, unlike Path.glob/rglob which stat each yielded path.
+        """
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.name.startswith('.'): # Skip hidden files/dirs
+                            continue
+                        if recursive and entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        yield entry
+            except OSError as e:
+                logger.error(f"Error scanning NER directory {current}: {e}")
 
     def list_categories(self) -> List[str]:
-        """Lists top-level directories (categories) in NER, ignoring dotfiles/dirs.".""
+        """Lists top-level directories (categories) in NER, ignoring dotfiles/dirs."""
         try:
             return sorted([d.name for d in self.ner_root.iterdir() if d.is_dir() and not d.name.startswith('.')])
         except OSError as e:
             logger.error(f"Error listing NER categories in {self.ner_root}: {e}")
             return []
 
-    def list_items_in_category(self, category_path_relative: str, recursive: bool = False) -> List[Dict[str, str]]:
+    def iter_items_in_category(self, category_path_relative: str, recursive: bool = False) -> Iterator[Dict[str, str]]:
         """
-        Lists items (files and subdirectories) in a given NER category.
-        Returns a list of dicts, each with 'name', 'type' ('file'/'directory'), 'relative_path'.
+        Streams items (files and subdirectories) in a given NER category.
+        Yields dicts with 'name', 'type' ('file'/'directory'), 'relative_path'
+        as the walk produces them, so first-result latency and memory are
+        independent of tree size. Recursive walks are unordered; callers that
+        need a sorted view sort the (materialized) result themselves.
         """
-        category_abs_path = (self.ner_root / category_path_relative).resolve()
-        if not str(category_abs_path).startswith(str(self.ner_root)):
+        category_abs = self._safe_abs(category_path_relative)
+        if category_abs is None:
             logger.warning(f"Attempt to list items outside NER root rejected: {category_path_relative}")
-            return []
-        if not category_abs_path.is_dir():
-            logger.warning(f"Category path is not a directory: {category_abs_path}")
-            return []
+            return
+        if not os.path.isdir(category_abs):
+            logger.warning(f"Category path is not a directory: {category_abs}")
+            return
 
-        items = []
-        glob_pattern = "**/*" if recursive else "*"
+        # entry.path is always rooted under the prefix, so the relative path is
+        # a slice — no os.path.relpath normalization, no Path allocations.
+        rel_start = len(self._ner_root_prefix)
+        entries = self._iter_entries(category_abs, recursive)
+        if not recursive:
+            # A single directory's listing is small; sorting it keeps the
+            # common browse case stable without forcing full-tree traversal.
+            entries = sorted(entries, key=lambda e: e.name)
+        # Paths are made relative to NER root for consistency in representation.
+        for entry in entries:
+            yield {
+                "name": entry.name,
+                "type": "directory" if entry.is_dir(follow_symlinks=False) else "file",
+                "relative_path_to_ner": entry.path[rel_start:],
+                "absolute_path": entry.path
+            }
 
-        try:
-            for item_path in sorted(category_abs_path.glob(glob_pattern)):
-                if item_path.name.startswith('.'): # Skip hidden files/dirs
-                    continue
+    def list_items_in_category(self, category_path_relative: str, recursive: bool = False) -> List[Dict[str, str]]:
+        """Materialized wrapper around iter_items_in_category for existing callers."""
+        return list(self.iter_items_in_category(category_path_relative, recursive))
 
-                # For recursive, we want paths relative to the initial category_abs_path
-                # For non-recursive, paths relative to category_abs_path will just be item.name
-                # This formulation makes it relative to NER root for consistency in representation.
-                path_relative_to_ner_root = item_path.relative_to(self.ner_root)
+    def get_item_content(self, item_relative_path_to_ner: str) -> Optional[str]:
+        """
+        Reads and returns the content of a file in NER. Repeat requests for an
+        unchanged file (e.g. iterating on the same template) are served from
+        an in-process cache keyed by the file's mtime.
+        """
+        item_abs = self._safe_abs(item_relative_path_to_ner)
+        if item_abs is None:
+            logger.warning(f"Attempt to read item outside NER root rejected: {item_relative_path_to_ner}")
+            return None
 
-                item_type = "directory" if item_path.is_dir() else "file"
+        try:
+            item_stat = os.stat(item_abs)
+        except OSError:
+            logger.warning(f"Requested NER item is not a file or does not exist: {item_abs}")
+            return None # Or raise error
+        if not stat.S_ISREG(item_stat.st_mode):
+            logger.warning(f"Requested NER item is not a file or does not exist: {item_abs}")
+            return None # Or raise error
+        try:
+            return _read_text(item_abs, item_stat.st_mtime_ns)
+        except OSError as e:
+            logger.error(f"Error reading NER item {item_abs}: {e}")
+            return f"# ERROR: Could not read file: {e.strerror}"
+        except UnicodeDecodeError as e:
+            logger.error(f"Unicode decode error reading NER item {item_abs}: {e}")
+            return f"# ERROR: Could not decode file content (not valid UTF-8)."
 
-                # If not recursive and item is in a sub-sub-directory, skip it for non-recursive listing
-                if not recursive and item_path.parent != category_abs_path:
+    def build_index_async(self) -> None:
+        """
+        Warms the kernel dentry caches for NER's hot directories on a daemon
+        thread: the NER root, each top-level category, and the agent
+        template/profile dirs. By the time the user picks something to list,
+        the getdents results are already cached. Nothing is memoized
+        in-process, so listings stay live for the browse loop; the thread is
+        fire-and-forget and errors are swallowed.
+        """
+        root = self._ner_root_str
+
+        def _warm() -> None:
+            try:
+                with os.scandir(root) as it:
+                    targets = [entry.path for entry in it
+                               if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.')]
+            except OSError:
+                return
+            targets.append(os.path.join(root, "06_AGENT_BLUEPRINTS", "ex_work_agent", "templates"))
+            targets.append(os.path.join(root, "06_AGENT_BLUEPRINTS", "scribe_agent", "profiles"))
+            for path in targets:
+                try:
+                    with os.scandir(path) as it:
+                        for _ in it:
+                            pass
+                except OSError:
                     continue
 
-                items.append({
-                    "name": item_path.name,
-                    "type": item_type,
-                    "relative_path_to_ner": str(path_relative_to_ner_root),
-                    "absolute_path": str(item_path)
-                })
+        threading.Thread(target=_warm, name="ner-dir-warm", daemon=True).start()
+
+    def get_item_content_many(self, item_relative_paths: List[str]) -> List[Optional[str]]:
+        """
+        Reads several NER items concurrently, preserving input order. The
+        files are independent, so reads overlap in a small thread pool and
+        wall time approaches the slowest single read instead of the sum.
+        """
+        if not item_relative_paths:
+            return []
+        if len(item_relative_paths) == 1:
+            return [self.get_item_content(item_relative_paths[0])]
+        workers = min(8, len(item_relative_paths))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.get_item_content, item_relative_paths))
+
+    def get_item_bytes(self, item_relative_path_to_ner: str) -> Optional[bytes]:
+        """
+        Raw bytes of a NER file, for consumers that parse rather than display:
+        orjson and yaml take bytes directly, so this path skips the UTF-8
+        decode (and later re-encode) that get_item_content would pay.
+        """
+        item_abs = self._safe_abs(item_relative_path_to_ner)
+        if item_abs is None:
+            logger.warning(f"Attempt to read item outside NER root rejected: {item_relative_path_to_ner}")
+            return None
+        try:
+            with open(item_abs, "rb") as f:
+                return f.read()
         except OSError as e:
-            logger.error(f"Error listing items in NER category {category_abs_path}: {e}")
-        return items
+            logger.error(f"Error reading NER item {item_abs}: {e}")
+            return None
 
-    def get_item_content(self, item_relative_path_to_ner: str) -> Optional[str]:
-        """Reads and returns the content of a file in NER.".""
-        item_abs_path = (self.ner_root / item_relative_path_to_ner).resolve()
-        if not str(item_abs_path).startswith(str(self.ner_root)):
+    def get_item_parsed(self, item_relative_path_to_ner: str) -> Optional[Any]:
+        """
+        Reads a NER item and parses it by extension: .json via orjson when
+        installed (stdlib json otherwise), .yaml/.yml via libyaml's CSafeLoader
+        when available. The raw bytes go straight to the parser — no text
+        decode round-trip for JSON. Anything else returns the decoded text.
+        """
+        item_abs = self._safe_abs(item_relative_path_to_ner)
+        if item_abs is None:
             logger.warning(f"Attempt to read item outside NER root rejected: {item_relative_path_to_ner}")
             return None
+        try:
+            with open(item_abs, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            logger.error(f"Error reading NER item {item_abs}: {e}")
+            return None
 
-        if item_abs_path.is_file():
-            try:
-                return item_abs_path.read_text(encoding="utf-8")
-            except OSError as e:
-                logger.error(f"Error reading NER item {item_abs_path}: {e}")
-                return f"# ERROR: Could not read file: {e.strerror}"
-            except UnicodeDecodeError as e:
-                logger.error(f"Unicode decode error reading NER item {item_abs_path}: {e}")
-                return f"# ERROR: Could not decode file content (not valid UTF-8)."
-        else:
-            logger.warning(f"Requested NER item is not a file or does not exist: {item_abs_path}")
-            return None # Or raise error
+        ext = item_relative_path_to_ner.rsplit('.', 1)[-1].lower()
+        try:
+            if ext == "json":
+                return _json_loads(data)
+            if ext in ("yaml", "yml"):
+                return yaml.load(data, Loader=_YAML_SAFE_LOADER)
+            return data.decode("utf-8")
+        except (ValueError, yaml.YAMLError, UnicodeDecodeError) as e:
+            logger.error(f"Error parsing NER item {item_abs}: {e}")
+            return None
 
-    def search_ner(self, query: str, search_in_category: Optional[str] = None) -> List[Dict[str, Any]]:
+    def search_ner(self, query: Union[str, List[str]], search_in_category: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Searches NER content for a query string.
+        Searches NER content for a query string, or a list of terms (any-match).
         Returns a list of matches, potentially with context snippets.
-        TODO, Architect: Implement robust search (e.g., ripgrep integration, Whoosh index).
-                         For now, a basic filename and content grep placeholder.
+        Multi-term queries are folded into one combined pattern so each file is
+        scanned once regardless of term count. Content scanning shells out to
+        ripgrep when available; the pure-Python read-and-scan loop remains as
+        the fallback.
         """
-        logger.info(f"Searching NER for '{query}'{f' in category {search_in_category}' if search_in_category else ''}...")
-        results = []
-        search_root = (self.ner_root / search_in_category).resolve() if search_in_category else self.ner_root
-
-        if not str(search_root).startswith(str(self.ner_root)) or not search_root.is_dir():
-            logger.error(f"Invalid search root for NER search: {search_root}")
+        terms = [t for t in ([query] if isinstance(query, str) else query) if t]
+        if not terms:
             return []
+        query_display = " | ".join(terms)
+        logger.info(f"Searching NER for '{query_display}'{f' in category {search_in_category}' if search_in_category else ''}...")
+        search_root_str = self._safe_abs(search_in_category) if search_in_category else self._ner_root_str
+        if search_root_str is None or not os.path.isdir(search_root_str):
+            logger.error(f"Invalid search root for NER search: {search_in_category}")
+            return []
+        search_root = Path(search_root_str)
 
+        # Preference order: persistent index (O(postings)), then ripgrep
+        # (vectorized scan), then the pure-Python fallback (full scan).
+        # Index verification is phrase-based, so only single-term queries
+        # use it; multi-term queries go straight to the scanners.
+        results = self._search_with_index(terms[0], search_root) if len(terms) == 1 else None
+        if results is None:
+            if self._rg_path:
+                results = self._search_with_ripgrep(terms, search_root)
+            else:
+                results = self._search_python(terms, search_root)
+
+        logger.info(f"NER search found {len(results)} item(s) for query '{query_display}'.")
+        return results
+
+    def _index_one_file(self, abs_path: str) -> Optional[Tuple[int, List[str], str]]:
+        """(mtime_ns, sorted unique tokens, bloom hex) for one file; None if unreadable/binary."""
         try:
-            for item_path in search_root.rglob("*"): # Recursive glob
-                if item_path.is_file() and not item_path.name.startswith('.'):
-                    match_found_in_filename = query.lower() in item_path.name.lower()
-                    match_found_in_content = False
-                    content_snippet = ""
+            mtime_ns = os.stat(abs_path).st_mtime_ns
+            with open(abs_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+        content_lc = content.lower()
+        unique_tokens = sorted(set(_TOKEN_RE.findall(content_lc)))
+        # Trigram Bloom filter (hex-encoded bitset) for cheap negative
+        # lookups: queries whose trigrams are not all present skip the file.
+        bloom = 0
+        for bit in _bloom_bits_for(_trigrams(content_lc.encode("utf-8"))):
+            bloom |= 1 << bit
+        return mtime_ns, unique_tokens, f"{bloom:x}"
 
+    def _write_index(self, index: Dict[str, Any]) -> bool:
+        """Persists the index and refreshes the in-process copy."""
+        try:
+            os.makedirs(os.path.dirname(self._index_file), exist_ok=True)
+            with open(self._index_file, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+        except OSError as e:
+            logger.error(f"Could not persist NER search index: {e}")
+            return False
+        self._index = index
+        self._index_mtime_ns = os.stat(self._index_file).st_mtime_ns
+        return True
+
+    def _changed_since(self, ref: str = "HEAD~1") -> Optional[List[str]]:
+        """
+        Relative paths changed since ref, from one batched
+        `git diff --name-only -z` call (NUL-delimited, rename/quote safe)
+        instead of per-file status queries. None when the NER is not a git
+        repository or git fails.
+        """
+        try:
+            result = subprocess.run(
+                ["git", "diff", "--name-only", "-z", ref],
+                cwd=self.ner_root, check=True, capture_output=True)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return [p.decode("utf-8") for p in result.stdout.split(b"\x00") if p]
+
+    def _reindex_changed(self, ref: str) -> Optional[int]:
+        """
+        Incremental reindex: replaces index entries only for files git reports
+        as changed since ref. The per-file token lists make removal of stale
+        postings O(tokens-in-file). Returns None when there is no loadable
+        index or no usable git diff (caller falls back to a full rebuild).
+        """
+        index = self._load_index()
+        changed = self._changed_since(ref)
+        if index is None or changed is None:
+            return None
+        files = index.setdefault("files", {})
+        tokens = index.setdefault("tokens", {})
+        file_tokens = index.setdefault("file_tokens", {})
+        blooms = index.setdefault("blooms", {})
+        for rel_path in changed:
+            # Mirror the walker's dot-entry pruning (covers .ner_index itself).
+            if rel_path.startswith('.') or '/.' in rel_path:
+                continue
+            for token in file_tokens.pop(rel_path, []):
+                paths = tokens.get(token)
+                if paths is not None:
                     try:
-                        content = item_path.read_text(encoding="utf-8")
-                        if query.lower() in content.lower():
-                            match_found_in_content = True
-                            # Basic snippet logic
-                            idx = content.lower().find(query.lower())
-                            start = max(0, idx - 50)
-                            end = min(len(content), idx + len(query) + 50)
-                            content_snippet = f"...{content[start:end]}..."
-                    except Exception:
-                        pass # Ignore read/decode errors for content search, focus on filename
-
-                    if match_found_in_filename or match_found_in_content:
-                        results.append({
-                            "name": item_path.name,
-                            "relative_path_to_ner": str(item_path.relative_to(self.ner_root)),
-                            "type": "file",
-                            "match_type": "filename_and_content" if match_found_in_filename and match_found_in_content                                                   else "filename" if match_found_in_filename else "content",
-                            "snippet": content_snippet if match_found_in_content else ""
-                        })
+                        paths.remove(rel_path)
+                    except ValueError:
+                        pass
+                    if not paths:
+                        del tokens[token]
+            files.pop(rel_path, None)
+            blooms.pop(rel_path, None)
+
+            file_info = self._index_one_file(os.path.join(self._ner_root_prefix, rel_path))
+            if file_info is None:
+                continue # Deleted or unreadable: entry stays removed
+            mtime_ns, unique_tokens, bloom_hex = file_info
+            files[rel_path] = mtime_ns
+            file_tokens[rel_path] = unique_tokens
+            blooms[rel_path] = bloom_hex
+            for token in unique_tokens:
+                tokens.setdefault(token, []).append(rel_path)
+
+        if not self._write_index(index):
+            return 0
+        logger.info(f"NER search index updated incrementally: {len(changed)} changed file(s).")
+        return len(files)
+
+    def reindex(self, changed_only: bool = False, ref: str = "HEAD~1") -> int:
+        """
+        Rebuilds the persistent inverted index under .ner_index/.
+
+        Maps lowercase word tokens to the relative paths containing them, plus
+        a per-file token list so individual entries can be replaced cheaply.
+        Built once (and refreshed after NER commits), it lets search_ner touch
+        only files whose postings match the query instead of scanning the
+        whole repository. With changed_only=True, only files git reports as
+        changed since ref are re-indexed (full rebuild if that is not
+        possible). Returns the number of files indexed.
+        """
+        if changed_only:
+            incremental_count = self._reindex_changed(ref)
+            if incremental_count is not None:
+                return incremental_count
+        tokens: Dict[str, List[str]] = {}
+        file_tokens: Dict[str, List[str]] = {}
+        files: Dict[str, int] = {}
+        blooms: Dict[str, str] = {}
+        rel_start = len(self._ner_root_prefix)
+        for entry in self._iter_entries(self._ner_root_str, recursive=True):
+            if entry.is_dir(follow_symlinks=False):
+                continue
+            file_info = self._index_one_file(entry.path)
+            if file_info is None:
+                continue # Unreadable/binary items are simply not indexed
+            rel_path = entry.path[rel_start:]
+            mtime_ns, unique_tokens, bloom_hex = file_info
+            files[rel_path] = mtime_ns
+            file_tokens[rel_path] = unique_tokens
+            blooms[rel_path] = bloom_hex
+            for token in unique_tokens:
+                tokens.setdefault(token, []).append(rel_path)
+
+        index = {"version": 2, "files": files, "tokens": tokens,
+                 "file_tokens": file_tokens, "blooms": blooms}
+        if not self._write_index(index):
+            return 0
+        logger.info(f"NER search index rebuilt: {len(files)} file(s), {len(tokens)} token(s).")
+        return len(files)
+
+    def _load_index(self) -> Optional[Dict[str, Any]]:
+        """Returns the persisted index, reloading it if the file changed on disk."""
+        try:
+            index_stat = os.stat(self._index_file)
+        except OSError:
+            return None
+        if self._index is None or index_stat.st_mtime_ns != self._index_mtime_ns:
+            try:
+                with open(self._index_file, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+                self._index_mtime_ns = index_stat.st_mtime_ns
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not load NER search index ({e}); falling back to scan.")
+                return None
+        return self._index
+
+    def _search_with_index(self, query: str, search_root: Path) -> Optional[List[Dict[str, Any]]]:
+        """
+        Index-backed content search: intersects the postings of the query's
+        tokens and verifies only those candidate files, instead of reading
+        everything. Returns None when no usable index exists (caller falls
+        back to ripgrep or the Python scan).
+        """
+        index = self._load_index()
+        if index is None:
+            return None
+        query_tokens = _TOKEN_RE.findall(query.lower())
+        if not query_tokens:
+            return None # Token-free queries (punctuation only) can't use postings
+
+        postings = index.get("tokens", {})
+        candidates: Optional[set] = None
+        for token in query_tokens:
+            # Substring semantics: the query token may occur inside longer
+            # indexed tokens ("edict" matches "edicts"), so union the postings
+            # of every vocabulary entry containing it. The vocabulary scan is
+            # tiny compared to re-reading file contents.
+            paths: set = set()
+            for indexed_token, token_paths in postings.items():
+                if token in indexed_token:
+                    paths.update(token_paths)
+            candidates = paths if candidates is None else candidates & paths
+            if not candidates:
+                break # Negative lookup: no file contains every token
+
+        root_prefix = "" if search_root == self.ner_root else os.path.relpath(str(search_root), self._ner_root_str) + os.sep
+        content_snippets: Dict[str, str] = {}
+        query_lc = query.lower()
+        # One case-insensitive search per file: no content.lower() copy and no
+        # second find() pass just to position the snippet window.
+        _, snippet_pattern = _compile_query_patterns((query_lc,))
+        # Bloom pre-filter: every query trigram must be present in a file's
+        # filter, or the phrase cannot occur and the read is skipped outright.
+        blooms = index.get("blooms", {})
+        query_bits = _bloom_bits_for(_trigrams(query_lc.encode("utf-8")))
+        for rel_path in candidates or ():
+            if root_prefix and not rel_path.startswith(root_prefix):
+                continue
+            bloom_hex = blooms.get(rel_path)
+            if bloom_hex is not None and query_bits:
+                bloom = int(bloom_hex, 16)
+                if any(not (bloom >> bit) & 1 for bit in query_bits):
+                    continue
+            # Verify for exact (phrase) matches: token intersection is a superset.
+            try:
+                content = (self.ner_root / rel_path).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            m = snippet_pattern.search(content)
+            if m is not None:
+                start = max(0, m.start() - 50)
+                end = min(len(content), m.end() + 50)
+                content_snippets[rel_path] = f"...{content[start:end]}..."
+
+        return self._merge_with_filename_matches([query], search_root, content_snippets)
+
+    def _search_with_ripgrep(self, terms: List[str], search_root: Path) -> List[Dict[str, Any]]:
+        """
+        Content search via `rg --json`: ripgrep mmaps files and runs a
+        vectorized fixed-string scan, so PAC only parses the NDJSON match
+        events instead of decoding and lowercasing every file itself. All
+        terms go into one invocation (-e per term), one pass over the tree.
+        Filename matching stays a cheap name-only walk (no file reads).
+        """
+        content_snippets: Dict[str, str] = {} # relative path -> first match snippet
+        rg_cmd = [self._rg_path, "--json", "--ignore-case", "--fixed-strings"]
+        for term in terms:
+            rg_cmd += ["-e", term]
+        rg_cmd += ["--", str(search_root)]
+        try:
+            proc = subprocess.Popen(rg_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if event.get("type") != "match":
+                    continue
+                data = event["data"]
+                match_path = data.get("path", {}).get("text", "")
+                if not match_path.startswith(self._ner_root_prefix):
+                    continue
+                rel_path = match_path[len(self._ner_root_prefix):]
+                if rel_path not in content_snippets:
+                    matched_line = data.get("lines", {}).get("text", "").strip()
+                    content_snippets[rel_path] = f"...{matched_line[:110]}..."
+            proc.wait()
         except OSError as e:
-            logger.error(f"Error during NER search in {search_root}: {e}")
+            logger.error(f"ripgrep search failed ({e}); falling back to Python scan.")
+            return self._search_python(terms, search_root)
 
-        logger.info(f"NER search found {len(results)} item(s) for query '{query}'.")
+        return self._merge_with_filename_matches(terms, search_root, content_snippets)
+
+    def _merge_with_filename_matches(self, terms: List[str], search_root: Path,
+                                     content_snippets: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Walks filenames under search_root (no file reads) and merges filename
+        matches with the given content hits into the search-result shape.
+        """
+        results: List[Dict[str, Any]] = []
+        terms_lc = [t.lower() for t in terms]
+        rel_start = len(self._ner_root_prefix)
+        for entry in self._iter_entries(str(search_root), recursive=True):
+            if entry.is_dir(follow_symlinks=False):
+                continue
+            rel_path = entry.path[rel_start:]
+            name_lc = entry.name.lower()
+            match_found_in_filename = any(t in name_lc for t in terms_lc)
+            snippet = content_snippets.get(rel_path)
+            if match_found_in_filename or snippet is not None:
+                results.append({
+                    "name": entry.name,
+                    "relative_path_to_ner": rel_path,
+                    "type": "file",
+                    "match_type": "filename_and_content" if match_found_in_filename and snippet is not None
+                                  else "filename" if match_found_in_filename else "content",
+                    "snippet": snippet or ""
+                })
+        return results
+
+    def _search_python(self, terms: List[str], search_root: Path) -> List[Dict[str, Any]]:
+        """
+        Fallback content scan, used when neither the index nor ripgrep apply.
+        All terms are folded into one alternation pattern, so each file gets a
+        single scan regardless of term count. Per-file scans are independent
+        and I/O-bound, so they fan out to a thread pool: the reads/mmap scans
+        release the GIL, letting the page cache and disk queue overlap instead
+        of serializing one file at a time.
+        """
+        rel_start = len(self._ner_root_prefix)
+        terms_lc = [t.lower() for t in terms] # Hoisted: one lowercase per query, not per file
+        query_pattern, snippet_pattern = _compile_query_patterns(tuple(terms_lc))
+
+        def scan_candidate(job) -> Optional[Dict[str, Any]]:
+            path, name, match_found_in_filename, entry_stat = job
+            match_found_in_content = False
+            content_snippet = ""
+
+            if entry_stat is None:
+                pass # Non-text extension: no open, no read
+            elif entry_stat.st_size > _MAX_SEARCH_BYTES:
+                pass # Too large for content search; filename match may still apply
+            elif entry_stat.st_size > _CACHE_MAX_BYTES:
+                match_found_in_content = _mmap_contains(path, query_pattern)
+            else:
+                content_bytes = _lower_content(path, entry_stat.st_mtime_ns)
+                match_found_in_content = (content_bytes is not None
+                                          and query_pattern.search(content_bytes) is not None)
+            if match_found_in_content:
+                try:
+                    # Decode only for matching files, to build the snippet.
+                    with open(path, "r", encoding="utf-8") as f:
+                        content = f.read()
+                    m = snippet_pattern.search(content)
+                    if m is not None:
+                        start = max(0, m.start() - 50)
+                        end = min(len(content), m.end() + 50)
+                        content_snippet = f"...{content[start:end]}..."
+                except Exception:
+                    pass # Ignore read/decode errors for content search, focus on filename
+
+            if match_found_in_filename or match_found_in_content:
+                return {
+                    "name": name,
+                    "relative_path_to_ner": path[rel_start:],
+                    "type": "file",
+                    "match_type": "filename_and_content" if match_found_in_filename and match_found_in_content
+                                  else "filename" if match_found_in_filename else "content",
+                    "snippet": content_snippet if match_found_in_content else ""
+                }
+            return None
+
+        def produce_candidates(out_q: "queue.Queue") -> None:
+            # Producer thread: walk directory metadata ahead of the content
+            # scans so getdents/stat I/O overlaps with the file reads, instead
+            # of the scan stalling at each new directory. A None sentinel
+            # signals end-of-walk.
+            batch = []
+            for entry in self._iter_entries(str(search_root), recursive=True):
+                if entry.is_dir(follow_symlinks=False):
+                    continue
+                _, ext_sep, ext = entry.name.rpartition('.')
+                entry_stat = None if (ext_sep and ext.lower() not in _TEXT_EXTS) else entry.stat()
+                name_lc = entry.name.lower()
+                batch.append((entry.path, entry.name, any(t in name_lc for t in terms_lc), entry_stat))
+                if len(batch) >= _PREFETCH_BATCH:
+                    out_q.put(batch)
+                    batch = []
+            if batch:
+                out_q.put(batch)
+            out_q.put(None)
+
+        def advise_batch(batch) -> None:
+            # Batched readahead: hint the whole batch to the kernel before the
+            # pool scans it, so the reads queue together instead of paying
+            # cold-cache latency file by file.
+            for path, _name, _name_match, entry_stat in batch:
+                if entry_stat is None or entry_stat.st_size > _MAX_SEARCH_BYTES:
+                    continue
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                    try:
+                        os.posix_fadvise(fd, 0, entry_stat.st_size, os.POSIX_FADV_WILLNEED)
+                    finally:
+                        os.close(fd)
+                except OSError:
+                    continue
+
+        candidate_q: "queue.Queue" = queue.Queue(maxsize=4)
+        threading.Thread(target=produce_candidates, args=(candidate_q,), daemon=True).start()
+
+        can_fadvise = hasattr(os, "posix_fadvise")
+        results: List[Dict[str, Any]] = []
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = []
+            while True:
+                batch = candidate_q.get()
+                if batch is None:
+                    break
+                if can_fadvise:
+                    advise_batch(batch)
+                futures.extend(pool.submit(scan_candidate, job) for job in batch)
+            for future in futures:
+                scan_result = future.result()
+                if scan_result is not None:
+                    results.append(scan_result)
         return results
 
     # TODO, Architect: Implement NER content creation, update, deletion methods
@@ -149,12 +826,106 @@ class NERHandler:
     #     # e.g., validate Ex-Work JSON against a schema, Scribe TOML structure
     #     pass
 
+    def git_status_ner(self) -> Tuple[bool, Union[Dict[str, str], str]]:
+        """
+        NER working-tree status as a {relative path: state} dict.
+
+        Uses pygit2 when available — libgit2 walks the index in-process, with
+        no fork/exec and no git binary startup — and otherwise falls back to a
+        single `git status --porcelain -z` subprocess parsed into the same
+        shape. Returns (False, error message) when neither works.
+        """
+        try:
+            import pygit2
+        except ImportError:
+            pygit2 = None
+        if pygit2 is not None:
+            try:
+                repo = pygit2.Repository(self._ner_root_str)
+                flag_labels = [
+                    ("GIT_STATUS_INDEX_NEW", "staged-new"),
+                    ("GIT_STATUS_INDEX_MODIFIED", "staged-modified"),
+                    ("GIT_STATUS_INDEX_DELETED", "staged-deleted"),
+                    ("GIT_STATUS_WT_NEW", "untracked"),
+                    ("GIT_STATUS_WT_MODIFIED", "modified"),
+                    ("GIT_STATUS_WT_DELETED", "deleted"),
+                    ("GIT_STATUS_CONFLICTED", "conflicted"),
+                ]
+                status: Dict[str, str] = {}
+                for path, flags in repo.status().items():
+                    labels = [label for const, label in flag_labels if flags & getattr(pygit2, const, 0)]
+                    status[path] = ", ".join(labels) if labels else hex(flags)
+                return True, status
+            except Exception as e:
+                logger.warning(f"pygit2 status failed ({e}); falling back to git subprocess.")
+        try:
+            result = subprocess.run(
+                ["git", "status", "--porcelain", "-z"],
+                cwd=self.ner_root, check=True, capture_output=True, text=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            return False, f"git status failed: {e}"
+        status = {}
+        records = iter(result.stdout.split("\x00"))
+        for record in records:
+            if not record:
+                continue
+            xy = record[:2]
+            status[record[3:]] = xy.strip() or "??"
+            # Renames/copies: -z emits the origin path as its own
+            # NUL-separated field; consume it so it isn't misparsed as the
+            # next record's "XY path" prefix.
+            if xy and xy[0] in "RC":
+                next(records, None)
+        return True, status
+
+    def _commit_with_pygit2(self, commit_message: str, add_all: bool) -> Optional[Tuple[bool, str]]:
+        """
+        In-process commit via libgit2 (pygit2): stages, writes the tree and
+        creates the commit without forking `git add .` + `git commit`, which
+        each rescan the working tree. Returns None when pygit2 is unavailable
+        or fails, so the caller can fall back to the subprocess path.
+        """
+        try:
+            import pygit2
+        except ImportError:
+            return None
+        try:
+            repo = pygit2.Repository(self._ner_root_str)
+            if add_all:
+                repo.index.add_all()
+            repo.index.write()
+            tree_id = repo.index.write_tree()
+            parents = [] if repo.head_is_unborn else [repo.head.target]
+            if parents and tree_id == repo.head.peel(pygit2.Tree).id:
+                return True, "No changes to commit in NER."
+            signature = repo.default_signature
+            commit_id = repo.create_commit("HEAD", signature, signature, commit_message, tree_id, parents)
+            # Keep the persistent search index in step with the committed tree.
+            if os.path.exists(self._index_file):
+                self.reindex(changed_only=True)
+            return True, f"NER changes committed successfully ({str(commit_id)[:12]})."
+        except Exception as e:
+            logger.warning(f"pygit2 commit failed ({e}); falling back to git subprocess.")
+            return None
+
     def git_commit_ner_changes(self, commit_message: str, add_all: bool = True) -> Tuple[bool, str]:
-        """Commits changes in the NER directory if it's a Git repository.".""
+        """Commits changes in the NER directory if it's a Git repository."""
         if not (self.ner_root / ".git").is_dir():
             return False, "NER is not a Git repository. Cannot commit."
 
+        pygit2_result = self._commit_with_pygit2(commit_message, add_all)
+        if pygit2_result is not None:
+            return pygit2_result
+
         try:
+            # Cheap pre-check: an empty porcelain status means nothing to do,
+            # so the common no-op path skips the full tree-walk of `git add .`.
+            status_result = subprocess.run(
+                ["git", "status", "--porcelain", "-z"],
+                cwd=self.ner_root, check=True, capture_output=True, text=True)
+            if not status_result.stdout:
+                return True, "No changes to commit in NER."
+
             if add_all:
                 add_cmd = ["git", "add", "."]
                 subprocess.run(add_cmd, cwd=self.ner_root, check=True, capture_output=True, text=True)
@@ -163,6 +934,9 @@ class NERHandler:
             result = subprocess.run(commit_cmd, cwd=self.ner_root, check=False, capture_output=True, text=True) # check=False to parse output
 
             if result.returncode == 0:
+                # Keep the persistent search index in step with the committed tree.
+                if os.path.exists(self._index_file):
+                    self.reindex(changed_only=True)
                 return True, f"NER changes committed successfully. Output:\n{result.stdout}"
             elif "nothing to commit" in result.stdout.lower() or "no changes added to commit" in result.stdout.lower():
                 return True, "No changes to commit in NER."
@@ -171,18 +945,18 @@ class NERHandler:
         except FileNotFoundError:
             return False, "'git' command not found. Ensure Git is installed and in PATH."
         except subprocess.CalledProcessError as e:
-            return False, f"Git 'add' command failed: {e.stderr}"
+            return False, f"Git command {e.cmd[1]!r} failed: {e.stderr}"
         except Exception as e:
             logger.error(f"Unexpected error during NER git commit: {e}", exc_info=True)
             return False, f"Unexpected error during Git commit: {e}"
 
     def git_pull_ner(self) -> Tuple[bool, str]:
-         """Pulls latest changes for the NER repository.".""
+         """Pulls latest changes for the NER repository."""
          # ... (Implementation similar to one in PAC main.py's _run_agent_command, but specific to NER path)
          # TODO, Architect: Implement robust git pull for NER, handling remotes, branches, conflicts.
          return False, "Git pull for NER not fully implemented yet."
 
     def git_push_ner(self) -> Tuple[bool, str]:
-         """Pushes NER changes to its remote.".""
+         """Pushes NER changes to its remote."""
          # TODO, Architect: Implement robust git push for NER.
-         return False, "Git push for NER not fully implemented yet."
\ No newline at end of file
+         return False, "Git push for NER not fully implemented yet."
@@ -5,34 +5,33 @@
 # Generated on: 2025-05-11T16:04:38.845390+00:00
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.json import JSON # For pretty printing JSON output from agents
+import functools
 import os
+import re
+import stat
 import sys
 from pathlib import Path
 import logging
-import json # For loading/parsing JSON from Ex-Work templates or agent output
-import shlex # For agent command construction if needed, though AgentRunner handles it
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 # --- Local Core Imports ---
-# Ensure pac_cli/app is discoverable (e.g. via PYTHONPATH, or if run with 'python -m app.main' from pac_cli)
-# Poetry's 'poetry run npac' or the launcher script should handle this.
-try:
+# Core modules (and their transitive Rich/TOML/httpx costs) are imported
+# lazily inside main_callback, so `npac --help` and shell-completion paths
+# never pay for them. The TYPE_CHECKING block keeps annotations resolvable
+# for tooling without importing anything at runtime.
+# pac_cli goes on sys.path once so `app.*` imports resolve regardless of how
+# main.py was launched (launcher script, `python -m app.main`, or direct
+# `python app/main.py`); the old try/except relative-import fallback is gone —
+# each failed import attempt walked every sys.meta_path finder for nothing.
+_PAC_CLI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PAC_CLI_DIR not in sys.path:
+    sys.path.insert(0, _PAC_CLI_DIR)
+
+if TYPE_CHECKING:
     from app.core.config_manager import ConfigManager
     from app.core.ner_handler import NERHandler
     from app.core.agent_runner import ExWorkAgentRunner, ScribeAgentRunner
     from app.core.llm_interface import LLMInterface
-    from app.utils import ui_utils # Using the alias for clarity
-except ImportError as e:
-    # This fallback might help if running main.py directly from app/ for quick tests,
-    # though it's not the standard execution method.
-    print(f"PAC Import ERROR: {e}. Attempting relative imports for dev mode.", file=sys.stderr)
-    from core.config_manager import ConfigManager
-    from core.ner_handler import NERHandler
-    from core.agent_runner import ExWorkAgentRunner, ScribeAgentRunner
-    from core.llm_interface import LLMInterface
-    from utils import ui_utils
 
 
 # --- Application Setup & Configuration ---
@@ -42,14 +41,16 @@ APP_VERSION: str = "2.0" # From npt_generator.py
 # NPT_BASE_DIR is critical. Launcher script (npac) sets this environment variable.
 # Fallback if run directly (e.g., python app/main.py during dev)
 NPT_BASE_DIR_ENV_VAR_NAME_IN_PAC: str = "NPT_BASE_DIR" # Literal string name from generator
-NPT_BASE_DIR: Path
-try:
-    NPT_BASE_DIR = Path(os.environ[NPT_BASE_DIR_ENV_VAR_NAME_IN_PAC]).resolve()
-except KeyError:
-    # Fallback for direct execution (e.g. from IDE without launcher)
-    NPT_BASE_DIR = Path(__file__).resolve().parent.parent.parent # app -> pac_cli -> NPT_BASE_DIR
-    # This print uses f-string interpolation correctly within main.py's scope
-    print(f"[WARN] {NPT_BASE_DIR_ENV_VAR_NAME_IN_PAC} env var not set. Defaulting NPT_BASE_DIR to: {NPT_BASE_DIR}", file=sys.stderr)
+# Resolved once at import with os.path.realpath (the env value when the
+# launcher set it, else the dev-mode fallback: app -> pac_cli -> NPT_BASE_DIR)
+# and exported straight back into the environment, so agent subprocesses
+# inherit the canonical path instead of each re-resolving it.
+_NPT_BASE_DIR_RESOLVED: str = os.path.realpath(
+    os.environ.get(NPT_BASE_DIR_ENV_VAR_NAME_IN_PAC)
+    or os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+)
+os.environ[NPT_BASE_DIR_ENV_VAR_NAME_IN_PAC] = _NPT_BASE_DIR_RESOLVED
+NPT_BASE_DIR: Path = Path(_NPT_BASE_DIR_RESOLVED)
 
 NER_DIR_NAME_CONST_IN_PAC: str = "ner_repository"
 PAC_CONFIG_DIR_NAME_CONST_IN_PAC: str = "config"
@@ -63,27 +64,71 @@ SETTINGS_FILENAME_CONST_IN_PAC: str = "settings.toml"
 # For now, basic stderr logging, configurable level by environment for dev.
 LOG_LEVEL_ENV_VAR = "PAC_LOG_LEVEL"
 DEFAULT_PAC_LOG_LEVEL = "INFO"
-pac_log_level_str = os.environ.get(LOG_LEVEL_ENV_VAR, DEFAULT_PAC_LOG_LEVEL).upper()
-numeric_log_level = getattr(logging, pac_log_level_str, logging.INFO)
-
-logging.basicConfig(
-    level=numeric_log_level,
-    format="%(asctime)s [%(name)-12s] [%(levelname)-7s] %(module)s:%(lineno)d - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[logging.StreamHandler(sys.stderr)] # Output to stderr
-)
+
 logger = logging.getLogger("PAC") # Main PAC application logger
-# Example: logger.info("PAC application starting...")
+
+
+def _configure_logging() -> None:
+    """
+    Configures PAC's stderr logging. Deferred out of import time so --help
+    and completion paths skip the env lookup, formatter build and handler
+    attach; guarded so a host embedding PAC (or a repeat callback) keeps its
+    own handlers.
+    """
+    if logging.getLogger().handlers:
+        return
+    pac_log_level_str = os.environ.get(LOG_LEVEL_ENV_VAR, DEFAULT_PAC_LOG_LEVEL).upper()
+    numeric_log_level = getattr(logging, pac_log_level_str, logging.INFO)
+    logging.basicConfig(
+        level=numeric_log_level,
+        format="%(asctime)s [%(name)-12s] [%(levelname)-7s] %(module)s:%(lineno)d - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[logging.StreamHandler(sys.stderr)] # Output to stderr
+    )
 
 # --- Global Instances (initialized in main_callback) ---
-config_manager: Optional[ConfigManager] = None
-ner_handler: Optional[NERHandler] = None
-ex_work_runner: Optional[ExWorkAgentRunner] = None
-scribe_runner: Optional[ScribeAgentRunner] = None
-llm_interface: Optional[LLMInterface] = None
-console = ui_utils.console # Use the shared console from ui_utils
+config_manager: Optional["ConfigManager"] = None
+ner_handler: Optional["NERHandler"] = None
+ex_work_runner: Optional["ExWorkAgentRunner"] = None
+scribe_runner: Optional["ScribeAgentRunner"] = None
+llm_interface: Optional["LLMInterface"] = None
+ui_utils = None # app.utils.ui_utils module, bound in main_callback
+
+
+def _get_llm_interface() -> "LLMInterface":
+    """
+    Constructs the LLMInterface on first use. The LLM stack (httpx etc.) is
+    the heaviest import in PAC, and most commands never touch it, so it only
+    loads when a command actually asks for the interface.
+    """
+    global llm_interface
+    if llm_interface is None:
+        from app.core.llm_interface import LLMInterface
+        llm_interface = LLMInterface(config_manager=config_manager, ex_work_runner=ex_work_runner)
+    return llm_interface
 
 # --- Typer Application Definition ---
+# Subcommand sniffing: Typer/Click build the parser tree (options, help
+# strings) eagerly for every registered group. When argv names exactly one
+# known group, only that group is registered; help, completion, unknown-token
+# and bare invocations fall back to registering everything so usage output
+# and error messages stay complete.
+_KNOWN_COMMAND_GROUPS = frozenset({"ner", "onap", "exwork", "scribe", "workflow", "system"})
+_SNIFFED_GROUP: Optional[str] = None
+if not os.environ.get("_NPAC_COMPLETE") and "--help" not in sys.argv:
+    for _arg in sys.argv[1:]:
+        if not _arg.startswith("-"):
+            if _arg in _KNOWN_COMMAND_GROUPS:
+                _SNIFFED_GROUP = _arg
+            break
+
+
+def _register_group(group_name: str, group_app: typer.Typer) -> None:
+    """Adds a command group to the app unless argv already names another one."""
+    if _SNIFFED_GROUP is None or _SNIFFED_GROUP == group_name:
+        app.add_typer(group_app)
+
+
 app = typer.Typer(
     name="npac",
     help=f"{APP_NAME} v{APP_VERSION} - Omnitide Nexus Command Console.", # Uses APP_NAME, APP_VERSION from this file
@@ -103,7 +148,19 @@ def main_callback(ctx: typer.Context,
     Main callback for PAC. Initializes core components and sets up context.
     Ensures NPT base and NER directories exist before any command runs.
     """
-    global config_manager, ner_handler, ex_work_runner, scribe_runner, llm_interface
+    global config_manager, ner_handler, ex_work_runner, scribe_runner, ui_utils
+
+    _configure_logging()
+
+    # Deferred core imports: only real command invocations reach this point,
+    # so --help/completion never execute them. The sys.path setup at module
+    # top guarantees the `app.*` form resolves in every run mode.
+    from app.core.config_manager import ConfigManager
+    from app.core.ner_handler import NERHandler
+    from app.core.agent_runner import ExWorkAgentRunner, ScribeAgentRunner
+    from app.utils import ui_utils
+    # ui_utils.console is a lazy singleton (PEP 562): it is constructed on
+    # first print, so pulling in ui_utils here costs no terminal probing.
 
     # if verbose: # Example for a global --verbose flag
     #     logging.getLogger("PAC").setLevel(logging.DEBUG)
@@ -121,10 +178,14 @@ def main_callback(ctx: typer.Context,
         logger.debug("No subcommand invoked, Typer will show help.")
         pass # Typer shows help
 
+    # NPT_BASE_DIR was resolved and exported into the environment at import
+    # time, so agent subprocesses simply inherit the parent env (see
+    # BaseAgentRunner._prepare_env) instead of each run() re-resolving it.
+
     # Critical: Ensure NPT_BASE_DIR is valid
     if not NPT_BASE_DIR.is_dir():
-        console.print(f"[bold red]CRITICAL ERROR: NPT Base Directory not found at '{NPT_BASE_DIR}'![/bold red]")
-        console.print("This directory is essential. Check NPT_BASE_DIR env var or bootstrap process.")
+        ui_utils.console.print(f"[bold red]CRITICAL ERROR: NPT Base Directory not found at '{NPT_BASE_DIR}'![/bold red]")
+        ui_utils.console.print("This directory is essential. Check NPT_BASE_DIR env var or bootstrap process.")
         raise typer.Exit(code=101)
 
     # Initialize ConfigManager
@@ -134,7 +195,7 @@ def main_callback(ctx: typer.Context,
         config_manager = ConfigManager(npt_base_dir=NPT_BASE_DIR, config_filename=SETTINGS_FILENAME_CONST_IN_PAC)
         logger.info(f"ConfigManager initialized. Settings loaded from: {config_manager.settings_file_path}")
     except Exception as e:
-        console.print(f"[bold red]CRITICAL ERROR: Failed to initialize PAC ConfigManager: {e}[/bold red]")
+        ui_utils.console.print(f"[bold red]CRITICAL ERROR: Failed to initialize PAC ConfigManager: {e}[/bold red]")
         logger.critical(f"Failed to initialize ConfigManager: {e}", exc_info=True)
         raise typer.Exit(code=102)
 
@@ -142,9 +203,9 @@ def main_callback(ctx: typer.Context,
     ner_path_str_from_config = config_manager.get("general.default_ner_path", str(NPT_BASE_DIR / NER_DIR_NAME_CONST_IN_PAC))
     ner_actual_path = Path(ner_path_str_from_config).resolve()
     if not ner_actual_path.is_dir():
-        console.print(f"[bold red]CRITICAL ERROR: NER Directory not found at '{ner_actual_path}'![/bold red]")
-        console.print(f"(Path from config 'general.default_ner_path' or default NPT structure).")
-        console.print(f"Please check path in {config_manager.settings_file_path} or ensure NER exists.")
+        ui_utils.console.print(f"[bold red]CRITICAL ERROR: NER Directory not found at '{ner_actual_path}'![/bold red]")
+        ui_utils.console.print(f"(Path from config 'general.default_ner_path' or default NPT structure).")
+        ui_utils.console.print(f"Please check path in {config_manager.settings_file_path} or ensure NER exists.")
         raise typer.Exit(code=103)
 
     # Initialize core handlers/runners
@@ -152,18 +213,27 @@ def main_callback(ctx: typer.Context,
         ner_handler = NERHandler(ner_root_path=ner_actual_path, config_manager=config_manager)
         ex_work_runner = ExWorkAgentRunner(config_manager=config_manager) # Gets agent path from config
         scribe_runner = ScribeAgentRunner(config_manager=config_manager) # Gets agent path from config
-        llm_interface = LLMInterface(config_manager=config_manager, ex_work_runner=ex_work_runner)
     except Exception as e:
-        console.print(f"[bold red]CRITICAL ERROR: Failed to initialize core PAC handlers (NER, Agents, LLM): {e}[/bold red]")
+        ui_utils.console.print(f"[bold red]CRITICAL ERROR: Failed to initialize core PAC handlers (NER, Agents): {e}[/bold red]")
         logger.critical(f"Failed to initialize core handlers: {e}", exc_info=True)
         raise typer.Exit(code=104)
 
+    # The profile-resolver cache is keyed on the NER root; clear it now that
+    # a (possibly different) handler exists.
+    _resolve_scribe_profile.cache_clear()
+
+    # Warm NER directory caches in the background for command groups that
+    # will list it momentarily; system/scribe invocations skip the walk.
+    if ctx.invoked_subcommand in ("ner", "onap", "exwork", "workflow"):
+        ner_handler.build_index_async()
+
     # Make instances available to subcommands via Typer context
     ctx.meta['config_manager'] = config_manager
     ctx.meta['ner_handler'] = ner_handler
     ctx.meta['ex_work_runner'] = ex_work_runner
     ctx.meta['scribe_runner'] = scribe_runner
-    ctx.meta['llm_interface'] = llm_interface
+    # LLM interface is constructed on demand; commands call the factory.
+    ctx.meta['llm_interface_factory'] = _get_llm_interface
 
     logger.info(f"PAC Core Components Initialized. NPT Base: {NPT_BASE_DIR}, NER Root: {ner_actual_path}")
     # Log agent paths from config for easier debugging if they are not found later
@@ -176,15 +246,39 @@ def main_callback(ctx: typer.Context,
 #                  e.g., from app.commands.ner_cmds import ner_app
 #                  This keeps main.py cleaner. For now, they are defined here.
 
+# Extension -> renderer dispatch for NER file display: one rpartition and a
+# dict lookup per view instead of a PurePath allocation and an if/elif chain.
+_EXT_DISPATCH = {
+    "md": ("markdown", None),
+    "json": ("syntax", "json"),
+    "toml": ("syntax", "toml"),
+    "yaml": ("syntax", "yaml"),
+    "py": ("syntax", "py"),
+    "sh": ("syntax", "sh"),
+}
+
+
+def _render_ner_file(content: str, name: str) -> None:
+    """Renders NER file content with the renderer matching its extension."""
+    _, _, ext = name.rpartition('.')
+    kind, lexer = _EXT_DISPATCH.get(ext.lower(), ("panel", None))
+    if kind == "markdown":
+        ui_utils.display_markdown(content, title=name)
+    elif kind == "syntax":
+        ui_utils.display_syntax(content, lexer, title=name)
+    else:
+        ui_utils.display_panel(content, title=name)
+
+
 ner_app = typer.Typer(name="ner", help="Interact with the Nexus Edict Repository (NER).", no_args_is_help=True)
-app.add_typer(ner_app)
+_register_group("ner", ner_app)
 
 @ner_app.command("browse", help="Interactively browse NER categories and items.")
 def ner_browse_cmd(ctx: typer.Context,
                    start_category: Optional[str] = typer.Argument(None, help="NER category to start Browse from (e.g., '00_CORE_EDICTS').", show_default=False),
                    search_query: Optional[str] = typer.Option(None, "--search", "-s", help="Search NER filenames and content (basic search).", show_default=False)
                    ):
-    """Interactively browse or search the NER.".""
+    """Interactively browse or search the NER."""
     current_ner_handler: NERHandler = ctx.meta['ner_handler'] # Assumes main_callback populated it
 
     if search_query:
@@ -218,14 +312,26 @@ def ner_browse_cmd(ctx: typer.Context,
         if current_path_in_ner != Path("."): # Allow going up if not at NER root
             display_items.append({ "name": "[.. Up one level ..]", "type": "action_up", "relative_path_to_ner": str(current_path_in_ner.parent) })
 
-        display_items.extend(sorted([item for item in items_in_dir if item['type'] == 'directory'], key=lambda x: x['name']))
-        display_items.extend(sorted([item for item in items_in_dir if item['type'] == 'file'], key=lambda x: x['name']))
+        # Structure-of-arrays ordering pass, directories first then files:
+        # the sort keys are pulled into two parallel flat arrays once, and the
+        # comparisons run over those instead of hashing into each item dict
+        # per comparison; the permutation is then applied to the dicts.
+        item_is_file = bytearray(item['type'] != 'directory' for item in items_in_dir)
+        item_names = [item['name'] for item in items_in_dir]
+        order = sorted(range(len(items_in_dir)), key=lambda i: (item_is_file[i], item_names[i]))
+        display_items.extend(items_in_dir[i] for i in order)
 
         if not display_items and current_path_in_ner == Path("."):
              ui_utils.console.print(f"[yellow]NER at '{current_ner_handler.ner_root}' appears empty.[/yellow]")
              break # Exit browser if NER root is empty
 
-        choices = [f"{item['name']}{'/' if item['type'] == 'directory' else ''}" for item in display_items]
+        # choice label -> display_items index, built once so the post-selection
+        # lookup is O(1) instead of a linear rescan of the choice list.
+        choice_to_idx = {
+            f"{item['name']}{'/' if item['type'] == 'directory' else ''}": i
+            for i, item in enumerate(display_items)
+        }
+        choices = list(choice_to_idx)
         choices.append("[Exit Browser]")
 
         selected_choice_str = ui_utils.fzf_select(choices, prompt=f"Browse {current_path_in_ner.name if current_path_in_ner.name else 'NER Root'}: ")
@@ -233,12 +339,7 @@ def ner_browse_cmd(ctx: typer.Context,
         if not selected_choice_str or selected_choice_str == "[Exit Browser]":
             break
 
-        selected_idx = -1
-        for i, choice_text in enumerate(choices): # Find index from selected string
-            if choice_text == selected_choice_str:
-                selected_idx = i
-                break
-
+        selected_idx = choice_to_idx.get(selected_choice_str, -1)
         if selected_idx == -1: continue # Should not happen with fzf
 
         selected_item_data = display_items[selected_idx]
@@ -250,14 +351,7 @@ def ner_browse_cmd(ctx: typer.Context,
         elif selected_item_data["type"] == "file":
             content = current_ner_handler.get_item_content(selected_item_data["relative_path_to_ner"])
             if content:
-                # Determine lexer for syntax highlighting
-                file_ext = Path(selected_item_data["name"]).suffix[1:].lower() if Path(selected_item_data["name"]).suffix else "text"
-                if file_ext == "md":
-                    ui_utils.display_markdown(content, title=selected_item_data["name"])
-                elif file_ext in ["json", "toml", "yaml", "py", "sh"]:
-                    ui_utils.display_syntax(content, file_ext, title=selected_item_data["name"])
-                else:
-                    ui_utils.display_panel(content, title=selected_item_data["name"])
+                _render_ner_file(content, selected_item_data["name"])
                 typer.prompt("Press Enter to continue Browse...", default="", show_default=False) # Pause
             else:
                 ui_utils.console.print(f"[red]Could not retrieve content for {selected_item_data['name']}.[/red]")
@@ -266,15 +360,11 @@ def ner_browse_cmd(ctx: typer.Context,
 
 @ner_app.command("view", help="View a specific NER item's content.")
 def ner_view_cmd(ctx: typer.Context, item_path_relative_to_ner: str = typer.Argument(..., help="Relative path to the NER item (e.g., '00_CORE_EDICTS/01_architect_supremacy.md').")):
-    """Displays the content of a specific file within NER.".""
+    """Displays the content of a specific file within NER."""
     current_ner_handler: NERHandler = ctx.meta['ner_handler']
     content = current_ner_handler.get_item_content(item_path_relative_to_ner)
     if content:
-        file_ext = Path(item_path_relative_to_ner).suffix[1:].lower() if Path(item_path_relative_to_ner).suffix else "text"
-        title = Path(item_path_relative_to_ner).name
-        if file_ext == "md": ui_utils.display_markdown(content, title=title)
-        elif file_ext in ["json", "toml", "yaml", "py", "sh"]: ui_utils.display_syntax(content, file_ext, title=title)
-        else: ui_utils.display_panel(content, title=title)
+        _render_ner_file(content, item_path_relative_to_ner.rsplit('/', 1)[-1])
     else:
         ui_utils.console.print(f"[red]NER item not found or could not be read: {item_path_relative_to_ner}[/red]")
         raise typer.Exit(code=1)
@@ -285,7 +375,9 @@ def ner_git_cmd(ctx: typer.Context,
                 commit_message: Optional[str] = typer.Option(None, "-m", "--message", help="Commit message (required for 'commit' action)."),
                 add_all_first: bool = typer.Option(True, "--add-all/--no-add-all", help="Run 'git add .' before commit (default: True).")
                 ):
-    """Manages the NER Git repository.".""
+    """Manages the NER Git repository."""
+    from rich.panel import Panel
+
     current_ner_handler: NERHandler = ctx.meta['ner_handler']
     action = action.lower()
 
@@ -298,14 +390,18 @@ def ner_git_cmd(ctx: typer.Context,
     output_message: str = "Action not performed."
 
     if action == "status":
-        # TODO, Architect: Use ner_handler for a more structured git status, or parse output better.
-        # For now, simple subprocess call.
-        # This command should be run using a generic method in NERHandler or a new utility
-        status_success, stdout, stderr = ui_utils.run_command(["git", "status"], cwd=current_ner_handler.ner_root, capture=True) # This ui_utils.run_command is conceptual
-        if status_success:
-            ui_utils.console.print(Panel(stdout if stdout else "No status output.", title="NER Git Status", border_style="cyan"))
+        # Structured status from NERHandler: pygit2 in-process when installed,
+        # one porcelain subprocess otherwise — never a full `git status` fork
+        # just to display text.
+        status_success, status_data = current_ner_handler.git_status_ner()
+        if not status_success:
+            ui_utils.console.print(Panel(f"Error getting status:\n{status_data}", title="NER Git Status Error", border_style="red"))
+            raise typer.Exit(code=1)
+        if not status_data:
+            ui_utils.console.print(Panel("Working tree clean.", title="NER Git Status", border_style="cyan"))
         else:
-            ui_utils.console.print(Panel(f"Error getting status:\nSTDERR: {stderr}\nSTDOUT: {stdout}", title="NER Git Status Error", border_style="red"))
+            ui_utils.display_table("NER Git Status", ["Path", "State"],
+                                   [[path, state] for path, state in sorted(status_data.items())])
         return # Status is display-only
 
     elif action == "pull":
@@ -329,6 +425,20 @@ def ner_git_cmd(ctx: typer.Context,
         if output_message: ui_utils.console.print(output_message)
         raise typer.Exit(code=1)
 
+@ner_app.command("reindex", help="Build or rebuild the persistent NER search index.")
+def ner_reindex_cmd(ctx: typer.Context,
+                    changed_only: bool = typer.Option(False, "--changed-only", help="Only re-index files git reports as changed since --ref (full rebuild if git is unavailable)."),
+                    ref: str = typer.Option("HEAD~1", "--ref", help="Git ref to diff against with --changed-only.")):
+    """Builds the inverted index under .ner_index/ that accelerates NER searches."""
+    current_ner_handler: NERHandler = ctx.meta['ner_handler']
+    count = current_ner_handler.reindex(changed_only=changed_only, ref=ref)
+    if count:
+        ui_utils.console.print(f"[green]NER search index updated: {count} file(s) indexed.[/green]")
+    elif changed_only:
+        ui_utils.console.print("[cyan]NER search index already up to date.[/cyan]")
+    else:
+        ui_utils.console.print("[yellow]NER search index could not be written (see log for details).[/yellow]")
+
 # TODO, Architect: Add more NER commands:
 # - ner create [--type <edict|template|profile...>] <relative_path_in_ner> [--editor]
 # - ner edit <relative_path_in_ner> [--editor]
@@ -338,7 +448,11 @@ def ner_git_cmd(ctx: typer.Context,
 # --- ONAP Command Group (Implementation using NERHandler & LLMInterface) ---
 # (Re-define onap_app if it wasn't added earlier, or get from app.add_typer)
 onap_app = typer.Typer(name="onap", help="Assemble and manage Omnitide Nexus Activation Protocol components.", no_args_is_help=True)
-app.add_typer(onap_app) # Ensure it's added to main app
+_register_group("onap", onap_app) # Ensure it's added to main app
+
+# TODO, Architect: Consider a more sophisticated separator or structure from NER itself.
+_ONAP_SEP = "\n\n---\nPROMPT_PART_SEPARATOR\n---\n\n"
+_ONAP_SUFFIX = "\n\n--- End of Assembled Omnitide Nexus Activation Context ---"
 
 @onap_app.command("assemble", help="Interactively assemble an ONAP prompt from NER/01_ONAP_R3_COMPONENTS.")
 def onap_assemble_cmd(ctx: typer.Context,
@@ -346,7 +460,7 @@ def onap_assemble_cmd(ctx: typer.Context,
                         copy_to_clipboard: bool = typer.Option(True, "--clip/--no-clip", "-x", help="Copy assembled prompt to clipboard."),
                         output_file: Optional[Path] = typer.Option(None, "--out", "-o", help="Save assembled prompt to file.", resolve_path=True, dir_okay=False, writable=True)
                         ):
-    """Assembles ONAP prompt components from NER and provides output options.".""
+    """Assembles ONAP prompt components from NER and provides output options."""
     current_ner_handler: NERHandler = ctx.meta['ner_handler']
     onap_components_dir_relative = "01_ONAP_R3_COMPONENTS" # Standardized path
 
@@ -364,24 +478,35 @@ def onap_assemble_cmd(ctx: typer.Context,
         ui_utils.console.print("[yellow]No ONAP parts selected for assembly.[/yellow]")
         return
 
-    assembled_prompt_content = []
+    import io
+
     ui_utils.console.print("\nAssembling from selected ONAP parts (in order of selection):")
-    for part_name in selected_parts_names: # fzf usually returns in selection order if --no-sort
-        part_relative_path_to_ner = f"{onap_components_dir_relative}/{part_name}"
+    # Batched concurrent reads via the handler; result order matches the
+    # selection order fzf returned.
+    part_rel_paths = [f"{onap_components_dir_relative}/{part_name}" for part_name in selected_parts_names]
+    part_contents = current_ner_handler.get_item_content_many(part_rel_paths)
+
+    # Stream parts into one StringIO buffer instead of collecting a second
+    # list of the same (potentially MB-sized) strings and joining: peak memory
+    # stays at roughly one copy of the assembled prompt.
+    buf = io.StringIO()
+    parts_written = 0
+    for part_name, content in zip(selected_parts_names, part_contents):
         ui_utils.console.print(f"  -> [cyan]{part_name}[/cyan]")
-        content = current_ner_handler.get_item_content(part_relative_path_to_ner)
         if content:
-            assembled_prompt_content.append(content)
+            if parts_written:
+                buf.write(_ONAP_SEP)
+            buf.write(content)
+            parts_written += 1
         else:
             ui_utils.console.print(f"    [yellow]Warning: Could not read content for {part_name}.[/yellow]")
 
-    if not assembled_prompt_content:
+    if not parts_written:
         ui_utils.console.print("[red]No content assembled (all selected files were empty or unreadable).[/red]")
         return
 
-    # TODO, Architect: Consider a more sophisticated separator or structure from NER itself.
-    final_prompt_str = "\n\n---\nPROMPT_PART_SEPARATOR\n---\n\n".join(assembled_prompt_content)
-    final_prompt_str += "\n\n--- End of Assembled Omnitide Nexus Activation Context ---"
+    buf.write(_ONAP_SUFFIX)
+    final_prompt_str = buf.getvalue()
 
     ui_utils.display_panel(final_prompt_str, title="Assembled ONAP Prompt", border_style="green", expand=False, padding_val=(1,1))
 
@@ -398,7 +523,17 @@ def onap_assemble_cmd(ctx: typer.Context,
     if output_file:
         try:
             output_file.parent.mkdir(parents=True, exist_ok=True) # Ensure parent dir exists
-            output_file.write_text(final_prompt_str, encoding='utf-8')
+            # One encode + one write syscall, skipping Python's buffered text
+            # layer; the fadvise hint keeps this write-and-forget prompt from
+            # displacing more useful page-cache entries.
+            final_prompt_bytes = final_prompt_str.encode("utf-8")
+            fd = os.open(str(output_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, final_prompt_bytes)
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
             ui_utils.console.print(f"[green]Assembled ONAP prompt saved to: {output_file.resolve()}[/green]")
         except OSError as e:
             ui_utils.console.print(f"[red]Error saving assembled ONAP prompt to '{output_file}': {e}[/red]")
@@ -409,7 +544,32 @@ def onap_assemble_cmd(ctx: typer.Context,
 
 # --- Ex-Work Command Group (Implementation using ExWorkAgentRunner) ---
 exwork_app = typer.Typer(name="exwork", help="Orchestrate Agent Ex-Work tasks.", no_args_is_help=True)
-app.add_typer(exwork_app)
+_register_group("exwork", exwork_app)
+
+
+def _substitute_params(node: Any, params: Dict[str, str]) -> Any:
+    """
+    Recursively substitutes {placeholder} tokens in the string leaves of a
+    parsed Ex-Work instruction block. Only tokens naming a declared
+    parameter are rewritten — braces belonging to the payload itself
+    (literal '{{', lone '}', positional '{0}') pass through untouched, and
+    operating on the parsed structure (never the raw JSON text) means
+    substitution can't break JSON escaping.
+    """
+    if not params:
+        return node
+    pattern = re.compile("|".join(r"\{" + re.escape(name) + r"\}" for name in params))
+
+    def _walk(value: Any) -> Any:
+        if isinstance(value, str):
+            return pattern.sub(lambda m: str(params[m.group(0)[1:-1]]), value)
+        if isinstance(value, list):
+            return [_walk(item) for item in value]
+        if isinstance(value, dict):
+            return {key: _walk(item) for key, item in value.items()}
+        return value
+
+    return _walk(node)
 
 @exwork_app.command("run", help="Run an Ex-Work instruction block from template, file, or string.")
 def exwork_run_cmd(ctx: typer.Context,
@@ -420,7 +580,12 @@ def exwork_run_cmd(ctx: typer.Context,
                    # TODO, Architect: Add --param "key=value" --param "key2=value2" for dynamic parameterization
                    # param_overrides: Optional[List[str]] = typer.Option(None, "--param", help="Override template parameters, format: 'key=value'. Repeat for multiple.")
                    ):
-    """Loads and runs an Ex-Work JSON instruction block.".""
+    """Loads and runs an Ex-Work JSON instruction block."""
+    try:
+        from orjson import loads as json_loads # SIMD-accelerated parse when installed
+    except ImportError:
+        from json import loads as json_loads
+
     runner: ExWorkAgentRunner = ctx.meta['ex_work_runner']
     current_ner_handler: NERHandler = ctx.meta['ner_handler']
     # config_mgr: ConfigManager = ctx.meta['config_manager'] # For default project path if needed
@@ -448,13 +613,7 @@ def exwork_run_cmd(ctx: typer.Context,
             raise typer.Exit(code=1)
         instruction_source_description = f"NER Template: {template_rel_path_in_ner}"
         ui_utils.console.print(f"Loaded Ex-Work instruction from {instruction_source_description}")
-        # TODO, Architect: Implement dynamic parameter parsing and replacement here.
-        # 1. Parse instruction_json_str to get "parameters" field (list of dicts).
-        # 2. For each param, use ui_utils.get_text_input to prompt user, using "prompt" and "default" from param def.
-        # 3. Replace "{placeholder_name}" in instruction_json_str with user-provided values.
-        #    Be careful with JSON string escaping if doing direct string replacement. Better to parse JSON,
-        #    walk the structure, and replace values, then re-serialize to JSON.
-        ui_utils.console.print("[italic yellow]TODO: Implement dynamic parameter replacement for template placeholders (e.g., {my_var}).[/italic yellow]")
+        # Parameter substitution happens below on the parsed structure.
 
     elif json_file:
         instruction_json_str = json_file.read_text("utf-8")
@@ -473,16 +632,33 @@ def exwork_run_cmd(ctx: typer.Context,
         ui_utils.console.print(f"[red]Failed to load Ex-Work instruction content from '{instruction_source_description}'.[/red]")
         raise typer.Exit(code=1)
 
-    # Validate basic JSON structure
+    # Validate basic JSON structure (parsed once here; the dict is handed to
+    # the runner so the text is never re-parsed downstream)
     try:
-        parsed_instr_for_validation = json.loads(instruction_json_str)
+        parsed_instr_for_validation = json_loads(instruction_json_str)
         if not isinstance(parsed_instr_for_validation, dict) or "actions" not in parsed_instr_for_validation:
             raise ValueError("JSON must be an object with an 'actions' key.")
-    except (json.JSONDecodeError, ValueError) as e:
+    except ValueError as e:
         ui_utils.console.print(f"[bold red]Invalid JSON structure for Ex-Work instruction from '{instruction_source_description}': {e}[/bold red]")
         ui_utils.display_syntax(instruction_json_str, "json", title="Invalid Ex-Work JSON Content")
         raise typer.Exit(code=1)
 
+    # Dynamic parameter substitution: templates may declare a "parameters"
+    # list of {"name", "prompt", "default"} dicts. Values are collected once,
+    # then substituted in a single walk over the already-parsed block.
+    param_defs = parsed_instr_for_validation.get("parameters")
+    if isinstance(param_defs, list) and param_defs:
+        params: Dict[str, str] = {}
+        for param_def in param_defs:
+            if not isinstance(param_def, dict) or "name" not in param_def:
+                continue
+            params[param_def["name"]] = ui_utils.get_text_input(
+                param_def.get("prompt", f"Value for '{param_def['name']}'"),
+                default_value=param_def.get("default")
+            )
+        if params:
+            parsed_instr_for_validation = _substitute_params(parsed_instr_for_validation, params)
+
     desc_preview = parsed_instr_for_validation.get("description", "N/A")
     num_actions_preview = len(parsed_instr_for_validation.get("actions", []))
     ui_utils.display_panel(
@@ -496,7 +672,7 @@ def exwork_run_cmd(ctx: typer.Context,
 
     ui_utils.console.print(f"Executing Ex-Work agent...")
     # ExWorkAgentRunner.execute_instruction_block returns (bool_success, dict_output_payload)
-    success, output_payload = runner.execute_instruction_block(instruction_json_str, project_path)
+    success, output_payload = runner.execute_instruction_block(parsed_instr_for_validation, project_path)
 
     # ui_utils.print_agent_output handles displaying the structured JSON output from Ex-Work nicely.
     ui_utils.print_agent_output("Ex-Work", success, output_payload, 
@@ -519,7 +695,19 @@ def exwork_run_cmd(ctx: typer.Context,
 
 # --- Scribe Command Group (Implementation using ScribeAgentRunner) ---
 scribe_app = typer.Typer(name="scribe", help="Orchestrate Project Scribe validations.", no_args_is_help=True)
-app.add_typer(scribe_app)
+_register_group("scribe", scribe_app)
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_scribe_profile(ner_root: str, base_name: str) -> Optional[str]:
+    """
+    Resolved absolute path of a Scribe profile in NER, or None if absent.
+    Cached so repeated scribe runs against the same profile (workflow loops,
+    batches) skip the stat+resolve; main_callback clears the cache when it
+    rebuilds the NER handler.
+    """
+    candidate = os.path.join(ner_root, "06_AGENT_BLUEPRINTS", "scribe_agent", "profiles", base_name)
+    return os.path.realpath(candidate) if os.path.isfile(candidate) else None
 
 @scribe_app.command("validate", help="Run Project Scribe validation gauntlet.")
 def scribe_validate_cmd(ctx: typer.Context,
@@ -532,7 +720,7 @@ def scribe_validate_cmd(ctx: typer.Context,
                         skip_tests: bool = typer.Option(False, "--skip-tests", help="Pass --skip-tests to Scribe agent.", rich_help_panel="Scribe Behavior"),
                         skip_review: bool = typer.Option(False, "--skip-review", help="Pass --skip-review to Scribe agent.", rich_help_panel="Scribe Behavior")
                         ):
-    """Runs the Scribe agent with specified parameters.".""
+    """Runs the Scribe agent with specified parameters."""
     runner: ScribeAgentRunner = ctx.meta['scribe_runner']
     current_ner_handler: NERHandler = ctx.meta['ner_handler']
     # config_mgr: ConfigManager = ctx.meta['config_manager']
@@ -549,9 +737,9 @@ def scribe_validate_cmd(ctx: typer.Context,
         base_name = profile_name if profile_name.endswith(".toml") else f"{profile_name}.toml"
         # Standard path for Scribe profiles in NER
         profile_rel_path_in_ner = f"06_AGENT_BLUEPRINTS/scribe_agent/profiles/{base_name}"
-        potential_profile_path = current_ner_handler.ner_root / profile_rel_path_in_ner
-        if potential_profile_path.is_file():
-            scribe_profile_abs_path = potential_profile_path.resolve()
+        resolved_profile = _resolve_scribe_profile(str(current_ner_handler.ner_root), base_name)
+        if resolved_profile:
+            scribe_profile_abs_path = Path(resolved_profile)
             ui_utils.console.print(f"Using Scribe profile from NER: [blue]{scribe_profile_abs_path}[/blue]")
         else:
             ui_utils.console.print(f"[yellow]Scribe profile '{base_name}' not found in NER at '{profile_rel_path_in_ner}'.[/yellow]")
@@ -560,8 +748,16 @@ def scribe_validate_cmd(ctx: typer.Context,
 
     ui_utils.console.print(f"Requesting Scribe validation for project: [cyan]{target_dir}[/cyan], target file relative: [cyan]{target_file_rel}[/cyan]")
 
+    # Scribe runs on a worker thread while the main thread keeps the UI live:
+    # a spinner with elapsed time instead of a frozen prompt, and Ctrl-C is
+    # handled promptly (the agent shares the foreground process group, so it
+    # receives the SIGINT as well).
+    import concurrent.futures
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
     # ScribeAgentRunner.run_validation returns (bool_success, dict_output_payload from Scribe)
-    success, output_payload = runner.run_validation(
+    future = executor.submit(
+        runner.run_validation,
         target_dir=target_dir,
         code_file=code_file,
         target_file_relative=target_file_rel,
@@ -571,6 +767,22 @@ def scribe_validate_cmd(ctx: typer.Context,
         skip_tests=skip_tests,
         skip_review=skip_review
     )
+    try:
+        from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+        with Progress(SpinnerColumn(), TextColumn("{task.description}"), TimeElapsedColumn(),
+                      console=ui_utils.console, transient=True) as progress:
+            progress.add_task("Scribe validation running…", total=None)
+            while True:
+                try:
+                    success, output_payload = future.result(timeout=0.2)
+                    break
+                except concurrent.futures.TimeoutError:
+                    continue
+    except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
+        ui_utils.console.print("\n[red]Scribe validation interrupted by Architect.[/red]")
+        raise typer.Exit(code=130)
+    executor.shutdown(wait=False)
 
     # ui_utils.print_agent_output handles structured display of Scribe's JSON report
     ui_utils.print_agent_output("Scribe", success, output_payload, 
@@ -583,7 +795,9 @@ def scribe_validate_cmd(ctx: typer.Context,
     if not success or scribe_overall_status != "SUCCESS":
         ui_utils.console.print(f"[bold red]Scribe validation reported failure or non-SUCCESS status ('{scribe_overall_status}').[/bold red]")
         # TODO, Architect: If Scribe output contains structured errors (e.g., lint issues), PAC could offer
-        # to automatically create an Ex-Work instruction to try and fix them.
+        # to automatically create an Ex-Work instruction to try and fix them. Compose the fix and its
+        # DIAGNOSE_ERROR follow-up together and submit via ExWorkAgentRunner.execute_instruction_blocks
+        # so both ride one agent start-up.
         raise typer.Exit(code=1)
     else:
         ui_utils.console.print(f"[bold green]Scribe validation reported overall status: {scribe_overall_status}.[/bold green]")
@@ -595,33 +809,143 @@ def scribe_validate_cmd(ctx: typer.Context,
 
 # --- Workflow Command Group (Conceptual Stubs) ---
 workflow_app = typer.Typer(name="workflow", help="Define and execute multi-step NPT workflows.", no_args_is_help=True)
-app.add_typer(workflow_app)
+_register_group("workflow", workflow_app)
+
+def _workflow_depth_groups(steps: "list[Dict[str, Any]]") -> "list[list[Dict[str, Any]]]":
+    """
+    Groups workflow steps by dependency depth: depth 0 steps have no
+    depends_on, depth N steps depend only on steps at shallower depths.
+    Steps within one depth are independent and safe to run concurrently.
+    Raises ValueError on unknown or cyclic dependencies.
+    """
+    by_id = {s["id"]: s for s in steps if isinstance(s, dict) and "id" in s}
+    depths: Dict[str, int] = {}
+
+    def _depth_of(step_id: str, stack: "tuple[str, ...]" = ()) -> int:
+        if step_id in depths:
+            return depths[step_id]
+        if step_id not in by_id:
+            raise ValueError(f"Unknown step dependency: {step_id!r}")
+        if step_id in stack:
+            raise ValueError(f"Cyclic step dependency involving {step_id!r}")
+        deps = by_id[step_id].get("depends_on") or []
+        depth = 0 if not deps else 1 + max(_depth_of(d, stack + (step_id,)) for d in deps)
+        depths[step_id] = depth
+        return depth
+
+    for step_id in by_id:
+        _depth_of(step_id)
+    groups: "list[list[Dict[str, Any]]]" = []
+    for step_id, step in by_id.items():
+        depth = depths[step_id]
+        while len(groups) <= depth:
+            groups.append([])
+        groups[depth].append(step)
+    return groups
+
+
+async def _run_workflow_groups(groups: "list[list[Dict[str, Any]]]",
+                               run_step: Any,
+                               max_parallel: int) -> Dict[str, Any]:
+    """
+    Executes depth groups in order; steps inside a group fan out via
+    asyncio.gather with run_step (a sync callable — runners are
+    subprocess-bound) pushed to worker threads, bounded by a semaphore.
+    Wall time per depth is the slowest step, not the sum.
+    """
+    import asyncio
+
+    sem = asyncio.Semaphore(max_parallel)
+    results: Dict[str, Any] = {}
+
+    async def _one(step: Dict[str, Any]) -> Any:
+        async with sem:
+            return await asyncio.to_thread(run_step, step)
+
+    for group in groups:
+        outcomes = await asyncio.gather(*[_one(step) for step in group])
+        for step, outcome in zip(group, outcomes):
+            results[step["id"]] = outcome
+    return results
+
 
 @workflow_app.command("run", help="Run a defined NPT workflow from a NER file.")
 def workflow_run_cmd(ctx: typer.Context,
                      workflow_file_ner_path: str = typer.Argument(..., help="Relative path to the workflow definition file in NER (e.g., '07_SECURITY_TOOLS/red_team/scans/full_recon.workflow.json').")
                      ):
-    """Loads and executes a NPT workflow definition.".""
+    """Loads and executes a NPT workflow definition."""
     current_ner_handler: NERHandler = ctx.meta['ner_handler']
     # ExWork, Scribe runners, LLM interface are also in ctx.meta
 
     ui_utils.console.print(f"Attempting to run workflow from NER file: [cyan]{workflow_file_ner_path}[/cyan]")
-    workflow_content_str = current_ner_handler.get_item_content(workflow_file_ner_path)
+    # Bytes for the parsers (orjson and yaml consume bytes directly), decoded
+    # once only for display — no decode/re-encode round-trip per load.
+    workflow_bytes = current_ner_handler.get_item_bytes(workflow_file_ner_path)
 
-    if not workflow_content_str:
+    if not workflow_bytes:
         ui_utils.console.print(f"[red]Workflow file not found or empty in NER: '{workflow_file_ner_path}'[/red]")
         raise typer.Exit(code=1)
+    workflow_content_str = workflow_bytes.decode("utf-8", errors="replace")
+
+    # Parse the definition by suffix, preferring the C parsers: orjson for
+    # JSON (stdlib fallback), tomllib/tomli for TOML, libyaml's CSafeLoader
+    # for YAML when PyYAML was built against it. The parsed dict is what the
+    # future engine will consume; unknown suffixes are treated as JSON.
+    suffix = workflow_file_ner_path.rsplit('.', 1)[-1].lower()
+    try:
+        if suffix == "toml":
+            try:
+                import tomllib
+            except ModuleNotFoundError:
+                import tomli as tomllib
+            workflow_def = tomllib.loads(workflow_content_str)
+        elif suffix in ("yaml", "yml"):
+            import yaml
+            workflow_def = yaml.load(workflow_bytes, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        else:
+            try:
+                from orjson import loads as _wf_loads
+            except ImportError:
+                from json import loads as _wf_loads
+            workflow_def = _wf_loads(workflow_bytes)
+    except Exception as e:
+        ui_utils.console.print(f"[red]Could not parse workflow definition ({suffix}): {e}[/red]")
+        raise typer.Exit(code=1)
 
-    ui_utils.console.print("[italic yellow]TODO, Architect: Implement Workflow Engine Logic for PAC.[/italic yellow]")
-    ui_utils.console.print("Workflow Engine tasks would include:")
-    ui_utils.console.print("  1. Parsing the workflow definition (JSON or YAML from `workflow_content_str`).")
-    ui_utils.console.print("     - Define schema: sequence of steps, step types (exwork, scribe, ner, llm, user_prompt, conditional), parameters, data passing.")
-    ui_utils.console.print("  2. Validating the workflow structure.")
-    ui_utils.console.print("  3. Iterating through steps:")
-    ui_utils.console.print("     - Dynamically resolving parameters (user input, previous step output).")
-    ui_utils.console.print("     - Calling appropriate PAC core functions (ExWork/Scribe runners, NERHandler, LLMInterface, UIUtils for prompts).")
-    ui_utils.console.print("     - Handling step success/failure and conditional branching (e.g., 'if scribe_fails then run exwork_diagnose').")
-    ui_utils.console.print("     - Managing overall workflow state and producing a final report.")
+    if isinstance(workflow_def, dict):
+        declared_steps = workflow_def.get("steps")
+        ui_utils.console.print(f"Parsed workflow definition: {len(declared_steps) if isinstance(declared_steps, list) else 0} step(s) declared.")
+        if isinstance(declared_steps, list) and declared_steps:
+            # Dependency-depth execution plan: steps sharing a depth are
+            # independent and will fan out through _run_workflow_groups
+            # (asyncio.gather over worker threads, bounded by
+            # workflow.max_parallel_agents) once step execution lands.
+            try:
+                depth_groups = _workflow_depth_groups(declared_steps)
+            except (KeyError, ValueError) as e:
+                ui_utils.console.print(f"[red]Invalid workflow step graph: {e}[/red]")
+                raise typer.Exit(code=1)
+            max_parallel = ctx.meta['config_manager'].get("workflow.max_parallel_agents", 4)
+            ui_utils.console.print(
+                f"Execution plan ({len(depth_groups)} depth(s), up to {max_parallel} parallel agent(s)): "
+                + "; ".join(f"depth {d}: " + ", ".join(s['id'] for s in group)
+                            for d, group in enumerate(depth_groups))
+            )
+
+    # One console.print for the whole overview: each print call runs Rich's
+    # layout engine and a separate terminal write/flush.
+    ui_utils.console.print(
+        "[italic yellow]TODO, Architect: Implement Workflow Engine Logic for PAC.[/italic yellow]\n"
+        "Workflow Engine tasks would include:\n"
+        "  1. Parsing the workflow definition (JSON or YAML from `workflow_content_str`).\n"
+        "     - Define schema: sequence of steps, step types (exwork, scribe, ner, llm, user_prompt, conditional), parameters, data passing.\n"
+        "  2. Validating the workflow structure.\n"
+        "  3. Iterating through steps:\n"
+        "     - Dynamically resolving parameters (user input, previous step output).\n"
+        "     - Calling appropriate PAC core functions (ExWork/Scribe runners, NERHandler, LLMInterface, UIUtils for prompts).\n"
+        "     - Handling step success/failure and conditional branching (e.g., 'if scribe_fails then run exwork_diagnose').\n"
+        "     - Managing overall workflow state and producing a final report."
+    )
 
     ui_utils.display_syntax(workflow_content_str, Path(workflow_file_ner_path).suffix[1:].lower() or "json", title=f"Workflow Content: {Path(workflow_file_ner_path).name}")
     logger.warning("Workflow execution is a stub. Full implementation required by Architect.")
@@ -629,14 +953,26 @@ def workflow_run_cmd(ctx: typer.Context,
 
 # --- System/Admin Command Group ---
 system_app = typer.Typer(name="system", help="PAC system management, configuration, and diagnostics.", no_args_is_help=True)
-app.add_typer(system_app)
+_register_group("system", system_app)
+
+
+def _file_executable(path: Path) -> "tuple[bool, bool]":
+    """(is regular file, has an execute bit), answered by one os.stat instead
+    of a Path.is_file + os.access pair that each re-walk the inode."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False, False
+    return stat.S_ISREG(st.st_mode), bool(st.st_mode & 0o111)
 
 @system_app.command("config", help="View or modify PAC configuration settings.")
 def system_config_cmd(ctx: typer.Context,
                       key: Optional[str] = typer.Argument(None, help="Config key to get/set (e.g., 'general.user_name' or 'agents.ex_work_agent_path'). View all if no key.", show_default=False),
                       value: Optional[str] = typer.Argument(None, help="Value to set for the key (if setting). To clear a key, set value to 'NULL' or 'DEFAULT'.", show_default=False)
                       ):
-    """Manages PAC's settings.toml configuration.".""
+    """Manages PAC's settings.toml configuration."""
+    from rich.json import JSON # For pretty printing JSON output from agents
+
     cfg_mgr: ConfigManager = ctx.meta['config_manager']
 
     if key and value: # Set value
@@ -661,21 +997,27 @@ def system_config_cmd(ctx: typer.Context,
         retrieved_value = cfg_mgr.get(key)
         ui_utils.console.print(f"Config '{key}': [cyan]{retrieved_value if retrieved_value is not None else '[Not Set]'}[/cyan]")
     else: # View all current settings
-        settings_str = json.dumps(cfg_mgr.settings, indent=2, default=str) # Use json for pretty print of dict
+        try:
+            import orjson # C-extension serializer when installed; indent path of stdlib json is pure Python
+            settings_str = orjson.dumps(cfg_mgr.settings, option=orjson.OPT_INDENT_2, default=str).decode()
+        except ImportError:
+            import json
+            settings_str = json.dumps(cfg_mgr.settings, indent=2, default=str) # Use json for pretty print of dict
         ui_utils.display_panel(JSON(settings_str), title=f"Current PAC Settings (from {cfg_mgr.settings_file_path})", border_style="magenta")
-    ui_utils.console.print(f"
-Settings file: [dim]{cfg_mgr.settings_file_path}[/dim]")
+    ui_utils.console.print(f"\nSettings file: [dim]{cfg_mgr.settings_file_path}[/dim]")
 
 
 @system_app.command("check", help="Perform a system check for PAC environment and configurations.")
 def system_check_cmd(ctx: typer.Context):
-    """Runs diagnostic checks on the PAC setup.".""
+    """Runs diagnostic checks on the PAC setup."""
+    from app.core.agent_runner import _split_agent_cmd
+
     ui_utils.console.print(f"[bold underline]Performing PAC System Health Check (v{APP_VERSION})[/bold underline]\n")
     cfg_mgr: ConfigManager = ctx.meta['config_manager']
     ner_h: NERHandler = ctx.meta['ner_handler']
     exw_r: ExWorkAgentRunner = ctx.meta['ex_work_runner']
     scr_r: ScribeAgentRunner = ctx.meta['scribe_runner']
-    llm_i: LLMInterface = ctx.meta['llm_interface']
+    llm_i: LLMInterface = ctx.meta['llm_interface_factory']()
 
     checks_data = []
     def add_check(item: str, value: Any, status_ok: bool, notes: str = ""):
@@ -683,28 +1025,68 @@ def system_check_cmd(ctx: typer.Context):
         if not status_ok and not notes: notes = "Check configuration or path."
         checks_data.append([item, str(value), status_str, notes])
 
+    # Config lookups are cheap and synchronous; gather them first so every
+    # filesystem probe can be issued at once. Probed concurrently, the check
+    # costs the slowest single stat instead of the sum — which matters when
+    # the NER root lives on a network mount.
+    ner_path_from_cfg = cfg_mgr.get('general.default_ner_path', 'Not Set')
+    exw_path_cfg = cfg_mgr.get('agents.ex_work_agent_path')
+    exw_script_cmd_list = _split_agent_cmd(exw_path_cfg) if exw_path_cfg else ()
+    exw_script_actual_path = Path(exw_script_cmd_list[1]) if len(exw_script_cmd_list) > 1 and exw_script_cmd_list[0].endswith("python3") or exw_script_cmd_list[0].endswith("python") else Path(exw_script_cmd_list[0]) if exw_script_cmd_list else Path("")
+    scr_path_cfg = cfg_mgr.get('agents.scribe_agent_path')
+    scr_script_cmd_list = _split_agent_cmd(scr_path_cfg) if scr_path_cfg else ()
+    scr_script_actual_path = Path(scr_script_cmd_list[1]) if len(scr_script_cmd_list) > 1 and scr_script_cmd_list[0].endswith("python3") or scr_script_cmd_list[0].endswith("python") else Path(scr_script_cmd_list[0]) if scr_script_cmd_list else Path("")
+    py_exe_in_venv = sys.executable
+
+    # Per-invocation stat cache: checks that land on the same inode (now or
+    # as the check list grows) reuse one stat_result instead of re-probing.
+    stat_results: Dict[Path, Optional[os.stat_result]] = {}
+
+    def _st(p: Path) -> Optional[os.stat_result]:
+        if p not in stat_results:
+            try:
+                stat_results[p] = os.stat(p)
+            except OSError:
+                stat_results[p] = None
+        return stat_results[p]
+
+    def _is_dir(p: Path) -> bool:
+        st = _st(p)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
+    def _is_file(p: Path) -> bool:
+        st = _st(p)
+        return st is not None and stat.S_ISREG(st.st_mode)
+
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as probe_pool:
+        fut_base_dir = probe_pool.submit(_is_dir, NPT_BASE_DIR)
+        fut_settings = probe_pool.submit(_is_file, cfg_mgr.settings_file_path)
+        fut_ner_dir = probe_pool.submit(_is_dir, ner_h.ner_root)
+        fut_ner_git = probe_pool.submit(_is_dir, ner_h.ner_root / ".git")
+        fut_exw = probe_pool.submit(_file_executable, exw_script_actual_path) if exw_path_cfg else None
+        fut_scr = probe_pool.submit(_file_executable, scr_script_actual_path) if scr_path_cfg else None
+        fut_py = probe_pool.submit(_is_file, Path(py_exe_in_venv))
+    # Leaving the with-block waited for every probe; results are ready.
+
     # NPT Base and Config
-    add_check("NPT Base Directory", NPT_BASE_DIR, NPT_BASE_DIR.is_dir())
-    add_check("PAC Settings File", cfg_mgr.settings_file_path, cfg_mgr.settings_file_path.is_file(), "If missing, defaults are used and new file created on save.")
+    add_check("NPT Base Directory", NPT_BASE_DIR, fut_base_dir.result())
+    add_check("PAC Settings File", cfg_mgr.settings_file_path, fut_settings.result(), "If missing, defaults are used and new file created on save.")
 
     # NER
-    ner_path_from_cfg = cfg_mgr.get('general.default_ner_path', 'Not Set')
-    add_check("NER Directory (from config)", ner_path_from_cfg, ner_h.ner_root.is_dir(), f"Actual path used: {ner_h.ner_root}")
-    ner_git_ok = (ner_h.ner_root / ".git").is_dir()
-    add_check("NER Git Repository", ".git folder exists", ner_git_ok, "If false, NER is not a Git repo.")
+    add_check("NER Directory (from config)", ner_path_from_cfg, fut_ner_dir.result(), f"Actual path used: {ner_h.ner_root}")
+    add_check("NER Git Repository", ".git folder exists", fut_ner_git.result(), "If false, NER is not a Git repo.")
 
     # Core Agents
-    exw_path_cfg = cfg_mgr.get('agents.ex_work_agent_path')
-    exw_script_cmd_list = shlex.split(exw_path_cfg) if exw_path_cfg else []
-    exw_script_actual_path = Path(exw_script_cmd_list[1]) if len(exw_script_cmd_list) > 1 and exw_script_cmd_list[0].endswith("python3") or exw_script_cmd_list[0].endswith("python") else Path(exw_script_cmd_list[0]) if exw_script_cmd_list else Path("")
     add_check("Ex-Work Agent Path (config)", exw_path_cfg or "Not Set", bool(exw_path_cfg), "Must be set for Ex-Work commands.")
-    if exw_path_cfg: add_check("Ex-Work Script Executable/Exists", exw_script_actual_path, exw_script_actual_path.is_file() and (os.access(exw_script_actual_path, os.X_OK) or exw_script_cmd_list[0].endswith("python")), "Check path and permissions.")
+    if fut_exw is not None:
+        exw_is_file, exw_is_exec = fut_exw.result()
+        add_check("Ex-Work Script Executable/Exists", exw_script_actual_path, exw_is_file and (exw_is_exec or exw_script_cmd_list[0].endswith("python")), "Check path and permissions.")
 
-    scr_path_cfg = cfg_mgr.get('agents.scribe_agent_path')
-    scr_script_cmd_list = shlex.split(scr_path_cfg) if scr_path_cfg else []
-    scr_script_actual_path = Path(scr_script_cmd_list[1]) if len(scr_script_cmd_list) > 1 and scr_script_cmd_list[0].endswith("python3") or scr_script_cmd_list[0].endswith("python") else Path(scr_script_cmd_list[0]) if scr_script_cmd_list else Path("")
     add_check("Scribe Agent Path (config)", scr_path_cfg or "Not Set", bool(scr_path_cfg), "Must be set for Scribe commands.")
-    if scr_path_cfg: add_check("Scribe Script Executable/Exists", scr_script_actual_path, scr_script_actual_path.is_file() and (os.access(scr_script_actual_path, os.X_OK) or scr_script_cmd_list[0].endswith("python")), "Check path and permissions.")
+    if fut_scr is not None:
+        scr_is_file, scr_is_exec = fut_scr.result()
+        add_check("Scribe Script Executable/Exists", scr_script_actual_path, scr_is_file and (scr_is_exec or scr_script_cmd_list[0].endswith("python")), "Check path and permissions.")
 
     # LLM Interface
     add_check("LLM Provider (config)", llm_i.provider, True) # Provider always has a value
@@ -712,8 +1094,7 @@ def system_check_cmd(ctx: typer.Context):
     add_check("LLM Default Model (config)", llm_i.default_model or "Not Set", bool(llm_i.default_model), "Needed for LLM calls.")
 
     # Python Environment (PAC's venv)
-    py_exe_in_venv = sys.executable
-    add_check("PAC Python Executable", py_exe_in_venv, Path(py_exe_in_venv).is_file())
+    add_check("PAC Python Executable", py_exe_in_venv, fut_py.result())
     # TODO, Architect: Add check for key dependencies like fzf, git from system PATH if PAC relies on them directly.
 
     ui_utils.display_table(f"{APP_NAME} System Health Check", ["Component", "Value/Path", "Status", "Notes"], checks_data)
@@ -729,6 +1110,7 @@ if __name__ == "__main__":
     # This ensures that if main.py is run directly (e.g. `python app/main.py`),
     # the Typer app object is correctly invoked.
     # The main_callback will handle all initialization.
+    _configure_logging()
     logger.info(f"Starting {APP_NAME} v{APP_VERSION} directly via __main__ (dev/debug mode).")
     app()
 
@@ -1,44 +1,77 @@
 # pac_cli/app/utils/ui_utils.py
-from typing import List, Optional, Any, Dict
+from typing import Iterable, List, Optional, Any, Dict, Union
+import functools
+import shutil
 import subprocess
-from rich.console import Console
-from rich.table import Table
+import threading
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.markdown import Markdown
+from rich.text import Text
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.padding import Padding
+# Table, Syntax and Markdown are imported inside the functions that render
+# them: Syntax pulls in pygments and Markdown a full parser, and most CLI
+# invocations never display either. sys.modules makes repeat imports cheap.
 import logging
 
 logger = logging.getLogger(__name__)
-console = Console() # Global console for UI elements from this module
 
-def display_panel(content: str, title: Optional[str] = None, border_style: str = "blue", expand: bool = False, padding_val: Any = (1,2)):
+_console_singleton: Optional[Console] = None
+
+
+def _get_console() -> Console:
+    """Builds the shared Console on first use and publishes it as
+    `ui_utils.console` for callers that grabbed the attribute eagerly."""
+    global _console_singleton
+    if _console_singleton is None:
+        _console_singleton = Console()
+        globals()["console"] = _console_singleton
+    return _console_singleton
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562 lazy module attribute: Console() probes the terminal (isatty,
+    # env vars, width detection) at construction, so `ui_utils.console` is
+    # built on first access instead of at import.
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def display_panel(content: Any, title: Optional[str] = None, border_style: str = "blue", expand: bool = False, padding_val: Any = (1,2)):
+    # content may be a markup string or any Rich renderable (Text, Group, ...).
     # ... (rest of this function as previously defined) ...
     try:
-        console.print(Panel(content, title=title, border_style=border_style, expand=expand, padding=padding_val))
+        _get_console().print(Panel(content, title=title, border_style=border_style, expand=expand, padding=padding_val))
     except Exception as e:
         logger.error(f"Error displaying panel for title '{title}': {e}")
-        console.print(f"[bold red]Error rendering panel content.[/bold red]")
+        _get_console().print(f"[bold red]Error rendering panel content.[/bold red]")
 
 def display_markdown(markdown_text: str, title: Optional[str] = None):
     # ... (rest of this function as previously defined) ...
+    from rich.markdown import Markdown
     md = Markdown(markdown_text)
     if title:
-        console.print(Panel(md, title=title, border_style="green", expand=False))
+        _get_console().print(Panel(md, title=title, border_style="green", expand=False))
     else:
-        console.print(md)
+        _get_console().print(md)
 
 def display_syntax(code: str, language: str, title: Optional[str] = None, line_numbers: bool = True, theme: str = "monokai"):
     # ... (rest of this function as previously defined) ...
+    from rich.syntax import Syntax
     syntax = Syntax(code, language, theme=theme, line_numbers=line_numbers)
     if title:
-        console.print(Panel(syntax, title=title, border_style="blue", expand=False)) # expand=False for code typically
+        _get_console().print(Panel(syntax, title=title, border_style="blue", expand=False)) # expand=False for code typically
     else:
-        console.print(syntax)
+        _get_console().print(syntax)
 
 def display_table(title: str, columns: List[str], rows: List[List[Any]], column_styles: Optional[List[str]] = None):
     # ... (rest of this function as previously defined) ...
+    if not rows:
+        # No point running Rich table layout for an empty result set.
+        _get_console().print(f"[dim]{title}: (no rows)[/dim]")
+        return
+
+    from rich.table import Table
     table = Table(title=title, show_header=True, header_style="bold magenta")
     if not column_styles or len(column_styles) != len(columns):
         column_styles = [""] * len(columns) # Default style
@@ -49,70 +82,121 @@ def display_table(title: str, columns: List[str], rows: List[List[Any]], column_
     for row in rows:
         table.add_row(*(str(item) for item in row))
 
-    console.print(table)
+    _get_console().print(table)
 
 def select_from_list_rich(items: List[str], prompt_message: str, default_choice: Optional[str] = None) -> Optional[str]:
     # ... (rest of this function as previously defined) ...
     if not items:
         return None
-    console.print(Padding(prompt_message, (1,0,0,0)))
+    _get_console().print(Padding(prompt_message, (1,0,0,0)))
     for i, item_name in enumerate(items):
-        console.print(f"  [cyan]{i+1}[/cyan]. {item_name}")
+        _get_console().print(f"  [cyan]{i+1}[/cyan]. {item_name}")
 
+    # Validate with integer bounds rather than handing IntPrompt a
+    # materialized list of len(items)+1 choice strings to compare against
+    # linearly on every attempt.
+    default_idx = 0 if default_choice is None or default_choice not in items else items.index(default_choice) + 1
+    n_items = len(items)
     while True:
-        choice_num_str = IntPrompt.ask(
-            "Enter number of your choice (or 0 to cancel)",
-            choices=[str(i) for i in range(len(items) + 1)], 
-            show_choices=False, 
-            default=0 if default_choice is None or default_choice not in items else items.index(default_choice) + 1
-        )
-        if choice_num_str == 0: 
+        choice_num = IntPrompt.ask("Enter number of your choice (or 0 to cancel)", default=default_idx)
+        if choice_num == 0:
             return None
-        if 1 <= choice_num_str <= len(items):
-            return items[choice_num_str - 1]
-        console.print("[red]Invalid selection. Please try again.[/red]")
+        if 1 <= choice_num <= n_items:
+            return items[choice_num - 1]
+        _get_console().print("[red]Invalid selection. Please try again.[/red]")
 
-def fzf_select(items: List[str], prompt: str = "Select:", multi: bool = False, fzf_executable: str = "fzf") -> Optional[Union[str, List[str]]]:
+@functools.lru_cache(maxsize=4)
+def _resolve_fzf(name: str) -> Optional[str]:
+    """Absolute path of the fzf binary, cached so repeated selections skip
+    the PATH walk (and the subprocess attempt entirely when fzf is absent)."""
+    return shutil.which(name)
+
+
+def fzf_select(items: Iterable[str], prompt: str = "Select:", multi: bool = False, fzf_executable: str = "fzf", inline_threshold: int = 5) -> Optional[Union[str, List[str]]]:
     # ... (rest of this function as previously defined) ...
+    if not isinstance(items, list):
+        items = list(items) # Materialize once; the rich fallback needs a list too
     if not items:
         return [] if multi else None
 
-    items_str = "\n".join(items)
-    fzf_command = [fzf_executable, "--prompt", prompt, "--height", "40%", "--layout=reverse", "--border", "--ansi"]
+    if not multi and len(items) <= inline_threshold:
+        # Forking fzf (plus its terminal setup) costs more than picking from
+        # a handful of entries is worth; present these inline instead.
+        return select_from_list_rich(items, prompt)
+
+    resolved_fzf = _resolve_fzf(fzf_executable)
+    if resolved_fzf is None:
+        logger.error(f"fzf command ('{fzf_executable}') not found. Please install fzf or ensure it's in PATH.")
+        if not multi:
+            return select_from_list_rich(items, f"(fzf fallback) {prompt}")
+        _get_console().print("[red]fzf not found, cannot perform multi-selection. Try installing fzf.[/red]")
+        return []
+
+    fzf_command = [resolved_fzf, "--prompt", prompt, "--height", "40%", "--layout=reverse", "--border", "--ansi"]
     if multi:
         fzf_command.append("--multi")
 
     try:
-        process = subprocess.run(
+        # Candidates are streamed to fzf from a writer thread instead of
+        # pre-joining them into one buffer: no second full copy of the list
+        # in memory, and fzf starts filtering as soon as the first lines
+        # arrive on large NER catalogs.
+        process = subprocess.Popen(
             fzf_command,
-            input=items_str,
-            text=True,
-            capture_output=True,
-            check=False
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
         )
-        if process.returncode == 0: 
-            return process.stdout.strip().splitlines() if multi else process.stdout.strip()
-        elif process.returncode == 1: 
+
+        def _feed() -> None:
+            try:
+                for item in items:
+                    process.stdin.write(item.encode("utf-8"))
+                    process.stdin.write(b"\n")
+            except (BrokenPipeError, OSError):
+                pass # User confirmed/cancelled before the list finished streaming
+            finally:
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+
+        feeder = threading.Thread(target=_feed, name="fzf-feed", daemon=True)
+        feeder.start()
+        # Drain manually rather than via communicate(), which would close our
+        # stdin pipe out from under the feeder. fzf's stderr stays far below
+        # the pipe buffer, so sequential reads cannot deadlock.
+        stdout_bytes = process.stdout.read()
+        feeder.join()
+        stderr_bytes = process.stderr.read()
+        process.stdout.close()
+        process.stderr.close()
+        process.wait()
+        if process.returncode == 0:
+            stdout = stdout_bytes.decode("utf-8", errors="replace")
+            return stdout.strip().splitlines() if multi else stdout.strip()
+        elif process.returncode == 1:
             return [] if multi else None
-        elif process.returncode == 130: 
-            console.print("[yellow]Selection cancelled (ESC).[/yellow]")
+        elif process.returncode == 130:
+            _get_console().print("[yellow]Selection cancelled (ESC).[/yellow]")
             return [] if multi else None
-        else: 
-            logger.warning(f"fzf exited with unexpected code {process.returncode}. Stderr: {process.stderr.strip()}")
+        else:
+            stderr = stderr_bytes.decode("utf-8", errors="replace")
+            logger.warning(f"fzf exited with unexpected code {process.returncode}. Stderr: {stderr.strip()}")
             return [] if multi else None
     except FileNotFoundError:
         logger.error(f"fzf command ('{fzf_executable}') not found. Please install fzf or ensure it's in PATH.")
         if not multi:
              return select_from_list_rich(items, f"(fzf fallback) {prompt}")
         else:
-             console.print("[red]fzf not found, cannot perform multi-selection. Try installing fzf.[/red]")
+             _get_console().print("[red]fzf not found, cannot perform multi-selection. Try installing fzf.[/red]")
              return [] 
     except Exception as e:
         logger.error(f"Error using fzf: {e}", exc_info=True)
         if not multi:
             return select_from_list_rich(items, f"(fzf error fallback) {prompt}")
         else:
-            console.print(f"[red]Error using fzf: {e}. Multi-select unavailable.[/red]")
+            _get_console().print(f"[red]Error using fzf: {e}. Multi-select unavailable.[/red]")
             return []
 
 def get_user_confirmation(message: str, default_yes: bool = False) -> bool:
@@ -126,11 +210,54 @@ def get_text_input(prompt_message: str, default_value: Optional[str] = None, pas
     else:
         return Prompt.ask(prompt_message, password=password)
 
+# Status -> color tables for print_agent_output: one dict lookup per line
+# instead of re-evaluating ternaries (twice, for open and close tags) on
+# every action/step an agent reports.
+_OK_COLOR = {True: "green", False: "red"}
+_STEP_COLOR = {"SUCCESS": "green", "FAILURE": "red", "WARNING": "yellow", "SKIPPED": "dim"}
+
+# Prebuilt status lines: styled Text needs no markup-parser pass at render
+# time, and the two possible lines never change.
+_STATUS_TEXT = {
+    True: Text("Execution Status: SUCCESS", style="bold green"),
+    False: Text("Execution Status: FAILURE", style="bold red"),
+}
+
+
+def _ellipsize(s: str, n: int = 150) -> str:
+    """s unchanged when it fits, else its first n chars plus an ellipsis."""
+    return s if len(s) <= n else s[:n] + "…"
+
+
+def _format_action(i: int, res: Dict[str, Any]) -> str:
+    """One Ex-Work action-result line for print_agent_output."""
+    act_success = res.get('success', False)
+    act_type = res.get('action_type', 'UnknownAction')
+    act_msg_payload = res.get('message_or_payload', 'N/A')
+    if isinstance(act_msg_payload, dict):
+        act_msg_payload = "{...} (details in logs or full JSON output)"
+    elif isinstance(act_msg_payload, str):
+        act_msg_payload = _ellipsize(act_msg_payload)
+    act_color = _OK_COLOR[bool(act_success)]
+    return f"  {i+1}. {act_type}: [{act_color}]Succeeded: {act_success}[/{act_color}] - {act_msg_payload}"
+
+
+def _format_step(i: int, step_res: Dict[str, Any]) -> str:
+    """One Scribe validation-step line for print_agent_output."""
+    step_name = step_res.get('name', 'UnknownStep')
+    step_status = step_res.get('status', 'UNKNOWN')
+    step_msg_obj = step_res.get('details', {})
+    step_msg = step_msg_obj.get('message', step_res.get('error_message', 'No message.')) if isinstance(step_msg_obj, dict) else str(step_msg_obj)
+    step_msg = _ellipsize(str(step_msg), 100)
+    color = _STEP_COLOR.get(step_status, "green")
+    return f"  {i+1}. {step_name}: [{color}]{step_status}[/{color}] - {step_msg}"
+
+
 def print_agent_output(agent_name: str, success: bool, output_data: Dict[str, Any], raw_stdout: Optional[str], raw_stderr: Optional[str]):
     title = f"Output from {agent_name}"
-    border_color = "green" if success else "red"
+    border_color = _OK_COLOR[success]
 
-    content_parts = [f"[bold {'green' if success else 'red'}]Execution Status: {'SUCCESS' if success else 'FAILURE'}[/bold {'green' if success else 'red'}]"]
+    content_parts = []
 
     if "error" in output_data:
         content_parts.append(f"[bold red]Error Message:[/bold red] {output_data['error']}")
@@ -139,34 +266,18 @@ def print_agent_output(agent_name: str, success: bool, output_data: Dict[str, An
 
     if "action_results" in output_data and isinstance(output_data["action_results"], list):
         content_parts.append("\n[bold]Action Results:[/bold]")
-        for i, res in enumerate(output_data["action_results"]):
-            act_success = res.get('success', False)
-            act_type = res.get('action_type', 'UnknownAction')
-            act_msg_payload = res.get('message_or_payload', 'N/A')
-            if isinstance(act_msg_payload, dict):
-                act_msg_payload = f"{{...}} (details in logs or full JSON output)" # Correctly escaped for the outer f-string
-            elif isinstance(act_msg_payload, str) and len(act_msg_payload) > 150:
-                act_msg_payload = act_msg_payload[:150] + "..."
-
-                    content_parts.append(f"  {i+1}. {act_type}: [{'green' if act_success else 'red'}]Succeeded: {act_success}[/{'green' if act_success else 'red'}] - {act_msg_payload}") # <--- INSERT THE CONSTRUCTED STRING HERE
+        # One extend with a generator per loop: a single bounded-method
+        # dispatch instead of an append per row, which adds up for agents
+        # reporting hundreds of actions.
+        content_parts.extend(_format_action(i, res) for i, res in enumerate(output_data["action_results"]))
 
     elif "steps" in output_data and isinstance(output_data["steps"], list):
         # ... (Scribe steps overview as previously defined) ...
         content_parts.append("\n[bold]Scribe Validation Steps Overview:[/bold]")
-        for i, step_res in enumerate(output_data["steps"]):
-            step_name = step_res.get('name', 'UnknownStep')
-            step_status = step_res.get('status', 'UNKNOWN')
-            step_msg_obj = step_res.get('details', {})
-            step_msg = step_msg_obj.get('message', step_res.get('error_message', 'No message.')) if isinstance(step_msg_obj, dict) else str(step_msg_obj)
-            if len(str(step_msg)) > 100 : step_msg = str(step_msg)[:100] + "..."
-
-            color = "green"
-            if step_status == "FAILURE": color = "red"
-            elif step_status == "WARNING": color = "yellow"
-            elif step_status == "SKIPPED": color = "dim"
-            content_parts.append(f"  {i+1}. {step_name}: [{color}]{step_status}[/{color}] - {step_msg}")
+        content_parts.extend(_format_step(i, step_res) for i, step_res in enumerate(output_data["steps"]))
         if "overall_status" in output_data:
-             content_parts.append(f"\nScribe Overall Status: [bold {'green' if output_data['overall_status'] == 'SUCCESS' else 'red'}]{output_data['overall_status']}[/bold {'green' if output_data['overall_status'] == 'SUCCESS' else 'red'}]")
+             overall_color = _OK_COLOR[output_data['overall_status'] == 'SUCCESS']
+             content_parts.append(f"\nScribe Overall Status: [bold {overall_color}]{output_data['overall_status']}[/bold {overall_color}]")
 
     elif not success and "error" not in output_data:
          if raw_stderr: content_parts.append(f"\n[bold red]Raw STDERR:[/bold red]\n{raw_stderr}")
@@ -174,4 +285,4 @@ def print_agent_output(agent_name: str, success: bool, output_data: Dict[str, An
 
     content_parts.append("\n[dim](Full JSON output from agent may contain more details. Check logs if errors occurred.)[/dim]")
 
-    display_panel("\n".join(content_parts), title=title, border_style=border_color)
+    display_panel(Group(_STATUS_TEXT[success], "\n".join(content_parts)), title=title, border_style=border_color)